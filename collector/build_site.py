@@ -1,14 +1,35 @@
 import json
 import glob
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-import pandas as pd
+
+import numpy as np
+
+import detail_pages
+from detail_pages import (
+    model_page_name,
+    render_detail_page,
+    render_models_index_html,
+    unit_page_name,
+)
+from diff_estimate import estimate_diff
+from event_analytics import build_event_index, event_comparisons, load_events
+from setting_estimate import estimate_settings
 
 DATA_DIR = Path("data/daily")
 DOCS_DIR = Path("docs")
 DOCS_DIR.mkdir(parents=True, exist_ok=True)
+MANIFEST_PATH = DOCS_DIR / "build-manifest.json"
+
+NUMERIC_COLUMNS = ["bb", "rb", "art", "total_start", "max_medals", "diff_medals"]
+PAYLOAD_COLUMNS = ["date", "machine_id", "machine_name"] + NUMERIC_COLUMNS
+# 一部の行にしか無い列。無い行ではキーごと省く（JS 側では undefined = null 扱い）
+OPTIONAL_COLUMNS = ["diff_estimated", "setting_mean"]
+DATA_CHUNK_DIR = "data"
 
 
-def load_all_rows():
+def read_daily_rows() -> list[dict]:
     files = sorted(glob.glob(str(DATA_DIR / "*.json")))
     rows = []
     for f in files:
@@ -18,20 +39,114 @@ def load_all_rows():
                 rows.extend(data)
         except Exception:
             continue
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
-    # 型整形
-    for c in ["bb", "rb", "art", "total_start", "max_medals", "diff_medals"]:
-        if c in df.columns:
-            df[c] = pd.to_numeric(df[c], errors="coerce")
-    df["date"] = df["date"].astype(str)
-    df["machine_id"] = df["machine_id"].astype(str).str.zfill(4)
-    df["machine_name"] = df["machine_name"].fillna("UNKNOWN").astype(str)
-    return df
-
-
-def write_style_css():
+    return rows
+
+
+def to_number(v):
+    """pd.to_numeric(errors="coerce") 相当。変換できなければ None。"""
+    if v is None:
+        return None
+    if isinstance(v, bool):
+        return int(v)
+    if isinstance(v, str):
+        s = v.strip()
+        try:
+            return int(s)
+        except ValueError:
+            pass
+        try:
+            v = float(s)
+        except ValueError:
+            return None
+    if isinstance(v, (int, float)):
+        return None if v != v else v
+    return None
+
+
+def load_all_records() -> list[dict]:
+    """
+    全日付の行を読み込んで型整形する（pandas は使わない）。
+    以前の pandas 版（pd.to_numeric + to_dict(orient="records")）と同じ値になるようにしている：
+    数値列は欠損が1つでもあれば float 列（欠損は NaN）、なければ int 列。
+    """
+    rows = read_daily_rows()
+    if not rows:
+        return []
+
+    columns = {}
+    for c in NUMERIC_COLUMNS:
+        vals = [to_number(r.get(c)) for r in rows]
+        if any(v is None or isinstance(v, float) for v in vals):
+            vals = [float("nan") if v is None else float(v) for v in vals]
+        columns[c] = vals
+
+    records = []
+    for i, r in enumerate(rows):
+        name = r.get("machine_name")
+        rec = {
+            "date": str(r.get("date")),
+            "machine_id": str(r.get("machine_id")).zfill(4),
+            "machine_name": "UNKNOWN" if name is None else str(name),
+        }
+        for c in NUMERIC_COLUMNS:
+            rec[c] = columns[c][i]
+        records.append(rec)
+    return records
+
+
+def add_diff_estimates(records: list[dict]):
+    """
+    差枚が null の行（machine4 が取れなかった台）を BB/RB/AT/累計からの推定値で埋める。
+    埋めた行にだけ diff_estimated=True を付ける（ページ側で「≈」付きで表示する）。
+    """
+    if not records:
+        return
+    diff = estimate_diff(
+        [r["machine_name"] for r in records],
+        [r["bb"] for r in records],
+        [r["rb"] for r in records],
+        [r["art"] for r in records],
+        [r["total_start"] for r in records],
+    )
+    missing = np.isnan(np.array([r["diff_medals"] for r in records], dtype=float))
+    fill = (missing & ~np.isnan(diff)).tolist()
+    for r, est, d in zip(records, fill, diff.tolist()):
+        if est:
+            r["diff_medals"] = d
+            r["diff_estimated"] = True
+
+
+def add_setting_estimates(records: list[dict]):
+    """
+    設定推測の結果（setting_mean: 設定期待値）を推測できた行にだけ付ける。
+    計算は全行まとめて1回。対象外機種・累計なしの行にはキーを付けない。
+    """
+    if not records:
+        return
+    _, mean = estimate_settings(
+        [r["machine_name"] for r in records],
+        [r["bb"] for r in records],
+        [r["rb"] for r in records],
+        [r["total_start"] for r in records],
+    )
+    ok = ~np.isnan(mean)
+    mean = np.round(mean, 2).tolist()
+    for r, has, m in zip(records, ok.tolist(), mean):
+        if has:
+            r["setting_mean"] = m
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def fingerprint(name: str, content: str) -> str:
+    """style.css -> style.<hash10>.css（中身が変わったときだけ名前が変わるのでキャッシュが効く）"""
+    stem, dot, ext = name.rpartition(".")
+    return f"{stem}.{content_hash(content)[:10]}{dot}{ext}"
+
+
+def render_style_css() -> str:
     css = """\
 :root{--bg:#0b0f19;--card:#111827;--text:#e5e7eb;--muted:#9ca3af;--line:#1f2937;--accent:#60a5fa;}
 *{box-sizing:border-box}
@@ -56,15 +171,15 @@ td.num{text-align:right;font-variant-numeric: tabular-nums}
 .swatch{width:16px;height:16px;border-radius:4px;border:1px solid var(--line)}
 hr{border:none;border-top:1px solid var(--line);margin:10px 0}
 """
-    (DOCS_DIR / "style.css").write_text(css, encoding="utf-8")
+    return css
 
 
-def build_index_html():
+def render_index_html(css_href: str) -> str:
     html = f"""\
 <!doctype html><html lang="ja"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
 <title>slot-heatmap</title>
-<link rel="stylesheet" href="style.css">
+<link rel="stylesheet" href="{css_href}">
 </head><body>
 <header><div class="container"><h1>slot-heatmap</h1><div class="small">差枚が取れない日は自動で最大持玉で表示します</div></div></header>
 <div class="container">
@@ -72,6 +187,8 @@ def build_index_html():
     <div class="row">
       <a class="badge" href="heatmap.html">差枚/最大持玉 ヒートマップ</a>
       <a class="badge" href="ranking.html">ランキング</a>
+      <a class="badge" href="models.html">機種別・台別</a>
+      <a class="badge" href="events.html">イベント日 vs 通常日</a>
     </div>
     <hr>
     <div class="small">
@@ -83,43 +200,71 @@ def build_index_html():
 </div>
 </body></html>
 """
-    (DOCS_DIR / "index.html").write_text(html, encoding="utf-8")
+    return html
 
 
-def build_pages(df: pd.DataFrame):
-    if df.empty:
+def render_pages(records: list[dict], css_href: str, event_index: dict[str, list[str]]) -> dict[str, str]:
+    if not records:
         # 空ページ
-        (DOCS_DIR / "heatmap.html").write_text(empty_page("heatmap"), encoding="utf-8")
-        (DOCS_DIR / "ranking.html").write_text(empty_page("ranking"), encoding="utf-8")
-        return
-
-    dates = sorted(df["date"].dropna().unique().tolist())
-    machine_names = sorted(df["machine_name"].dropna().unique().tolist())
-
-    # JSONを埋め込む（静的サイト用）
-    payload = df[
-        ["date", "machine_id", "machine_name", "bb", "rb", "art", "total_start", "max_medals", "diff_medals"]
-    ].to_dict(orient="records")
-
+        return {
+            "heatmap.html": empty_page("heatmap", css_href),
+            "ranking.html": empty_page("ranking", css_href),
+        }
+
+    by_date: dict[str, list[dict]] = {}
+    for r in records:
+        row = {c: payload_value(r[c]) for c in PAYLOAD_COLUMNS}
+        row.update({c: r[c] for c in OPTIONAL_COLUMNS if r.get(c) is not None})
+        by_date.setdefault(r["date"], []).append(row)
+    machine_names = sorted({r["machine_name"] for r in records})
+
+    # 行は日付ごとの指紋付きファイル（data/<date>.<hash>.js）に分ける。
+    # 過去の日のファイルは中身が変わらないので、毎晩増えるのはその日の分だけ
+    outputs = {}
+    chunk_srcs = []
+    for d in sorted(by_date):
+        chunk_content = f"DATA_CHUNKS.push({json.dumps(by_date[d], ensure_ascii=False)});\n"
+        chunk_src = fingerprint(f"{DATA_CHUNK_DIR}/{d}.js", chunk_content)
+        outputs[chunk_src] = chunk_content
+        chunk_srcs.append(chunk_src)
+
+    # 索引（日付・機種・イベント）は小さいので1つにまとめ、行は読み込んだ chunk をつなげる
     data_js = json.dumps(
         {
-            "dates": dates,
+            "dates": sorted(by_date),
             "machine_names": machine_names,
-            "rows": payload,
+            "events": event_index,
         },
         ensure_ascii=False,
     )
+    data_content = f"const DATA = {data_js};\nDATA.rows = DATA_CHUNKS.flat();\n"
+    data_src = fingerprint("data.js", data_content)
+    outputs[data_src] = data_content
+
+    # heatmap / ranking で同じデータを共有する（HTML に2回埋め込まない）
+    data_scripts = "\n".join(
+        ["<script>const DATA_CHUNKS = [];</script>"]
+        + [f'<script src="{src}"></script>' for src in chunk_srcs + [data_src]]
+    )
+    outputs["heatmap.html"] = render_heatmap_html(data_scripts, css_href)
+    outputs["ranking.html"] = render_ranking_html(data_scripts, css_href)
+    return outputs
 
-    build_heatmap_html(data_js)
-    build_ranking_html(data_js)
 
+def payload_value(v):
+    """
+    整数値の float は int で書く（JS では同じ値）。
+    列に欠損が1日でもあると全日の値が float になるので、そのままだと過去の日の chunk まで変わってしまう。
+    """
+    return int(v) if isinstance(v, float) and v.is_integer() else v
 
-def empty_page(kind: str) -> str:
+
+def empty_page(kind: str, css_href: str) -> str:
     title = "ヒートマップ" if kind == "heatmap" else "ランキング"
     return f"""\
 <!doctype html><html lang="ja"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
-<title>{title}</title><link rel="stylesheet" href="style.css"></head>
+<title>{title}</title><link rel="stylesheet" href="{css_href}"></head>
 <body>
 <header><div class="container"><h1>{title}</h1><div class="small"><a href="index.html">← 戻る</a></div></div></header>
 <div class="container"><div class="card">データがありません。先に collector/collect_daily.py を実行してください。</div></div>
@@ -127,12 +272,12 @@ def empty_page(kind: str) -> str:
 """
 
 
-def build_heatmap_html(data_js: str):
+def render_heatmap_html(data_scripts: str, css_href: str) -> str:
     html = f"""\
 <!doctype html><html lang="ja"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
 <title>ヒートマップ</title>
-<link rel="stylesheet" href="style.css">
+<link rel="stylesheet" href="{css_href}">
 </head><body>
 <header><div class="container">
   <h1>ヒートマップ</h1>
@@ -178,8 +323,8 @@ def build_heatmap_html(data_js: str):
   </div>
 </div>
 
+{data_scripts}
 <script>
-const DATA = {data_js};
 
 function esc(s) {{
   return String(s).replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;");
@@ -192,8 +337,8 @@ function toNum(v) {{
 
 function pickMetric(rows, userChoice) {{
   if (userChoice && userChoice !== "auto") return userChoice;
-  // auto: その画面の対象データで diff が1つでもあれば diff、なければ max
-  const hasDiff = rows.some(r => toNum(r.diff_medals) !== null);
+  // auto: その画面の対象データで（推定でない）diff が1つでもあれば diff、なければ max
+  const hasDiff = rows.some(r => toNum(r.diff_medals) !== null && !r.diff_estimated);
   return hasDiff ? "diff_medals" : "max_medals";
 }}
 
@@ -204,9 +349,12 @@ function modeText(metric) {{
 function noteText(metric, rows) {{
   if (metric === "max_medals") {{
     // diffが無いからmaxになった可能性が高いのでメッセージ出す
-    const hasDiff = rows.some(r => toNum(r.diff_medals) !== null);
+    const hasDiff = rows.some(r => toNum(r.diff_medals) !== null && !r.diff_estimated);
     if (!hasDiff) return "※ 差枚が取得できないため最大持玉で表示中（machine4が一時停止中の可能性）";
   }}
+  if (metric === "diff_medals" && rows.some(r => r.diff_estimated)) {{
+    return "※ ≈ 付きは BB/RB/累計からの推定差枚（machine4 が取れなかった台）";
+  }}
   return "";
 }}
 
@@ -241,12 +389,14 @@ function buildTable(rows, metric, plusOnly) {{
   const dates = Array.from(new Set(rows.map(r => r.date))).sort();
   const ids = Array.from(new Set(rows.map(r => r.machine_id))).sort();
 
-  // 値マップ
+  // 値マップ（推定差枚のセルは est に入れて ≈ を付ける）
   const map = new Map();
+  const est = new Set();
   for (const r of rows) {{
     const key = r.machine_id + "||" + r.date;
     const val = toNum(r[metric]);
     map.set(key, val);
+    if (metric === "diff_medals" && r.diff_estimated) est.add(key);
   }}
 
   // maxAbs（色の基準。最大値で濃く）
@@ -264,11 +414,14 @@ function buildTable(rows, metric, plusOnly) {{
 
   // 表（plusOnlyの場合は、行全体でプラスが1つもない台は薄く）
   let html = "<table><thead><tr><th>台番号</th>";
-  for (const d of dates) html += `<th>${{esc(d)}}</th>`;
+  for (const d of dates) {{
+    const ev = (DATA.events || {{}})[d];
+    html += ev ? `<th title="${{esc(ev.join(" / "))}}">★${{esc(d)}}</th>` : `<th>${{esc(d)}}</th>`;
+  }}
   html += "</tr></thead><tbody>";
 
   for (const id of ids) {{
-    html += `<tr><td>${{esc(id)}}</td>`;
+    html += `<tr><td><a href="unit/${{esc(id)}}.html">${{esc(id)}}</a></td>`;
     for (const d of dates) {{
       const key = id + "||" + d;
       const v = map.has(key) ? map.get(key) : null;
@@ -279,7 +432,7 @@ function buildTable(rows, metric, plusOnly) {{
       }}
 
       const bg = colorFor(show, metric, maxAbs);
-      const txt = (show === null) ? "" : String(show);
+      const txt = (show === null) ? "" : (est.has(key) ? "≈" : "") + String(show);
       html += `<td class="num" style="background:${{bg}}" data-v="${{show===null?"":show}}">${{esc(txt)}}</td>`;
     }}
     html += "</tr>";
@@ -326,15 +479,15 @@ init();
 
 </body></html>
 """
-    (DOCS_DIR / "heatmap.html").write_text(html, encoding="utf-8")
+    return html
 
 
-def build_ranking_html(data_js: str):
+def render_ranking_html(data_scripts: str, css_href: str) -> str:
     html = f"""\
 <!doctype html><html lang="ja"><head>
 <meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
 <title>ランキング</title>
-<link rel="stylesheet" href="style.css">
+<link rel="stylesheet" href="{css_href}">
 </head><body>
 <header><div class="container">
   <h1>ランキング</h1>
@@ -378,8 +531,8 @@ def build_ranking_html(data_js: str):
   </div>
 </div>
 
+{data_scripts}
 <script>
-const DATA = {data_js};
 
 function esc(s) {{
   return String(s).replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;");
@@ -390,7 +543,7 @@ function toNum(v) {{
 }}
 function pickMetric(rows, userChoice) {{
   if (userChoice && userChoice !== "auto") return userChoice;
-  const hasDiff = rows.some(r => toNum(r.diff_medals) !== null);
+  const hasDiff = rows.some(r => toNum(r.diff_medals) !== null && !r.diff_estimated);
   return hasDiff ? "diff_medals" : "max_medals";
 }}
 function modeText(metric) {{
@@ -398,9 +551,12 @@ function modeText(metric) {{
 }}
 function noteText(metric, rows) {{
   if (metric === "max_medals") {{
-    const hasDiff = rows.some(r => toNum(r.diff_medals) !== null);
+    const hasDiff = rows.some(r => toNum(r.diff_medals) !== null && !r.diff_estimated);
     if (!hasDiff) return "※ 差枚が取得できないため最大持玉で表示中（machine4が一時停止中の可能性）";
   }}
+  if (metric === "diff_medals" && rows.some(r => r.diff_estimated)) {{
+    return "※ ≈ 付きは BB/RB/累計からの推定差枚（machine4 が取れなかった台）";
+  }}
   return "";
 }}
 
@@ -414,10 +570,12 @@ function buildRanking(rows, metric, plusOnly) {{
       machine_id: r.machine_id,
       machine_name: r.machine_name,
       value: v,
+      estimated: metric === "diff_medals" && !!r.diff_estimated,
       bb: toNum(r.bb),
       rb: toNum(r.rb),
       art: toNum(r.art),
       total_start: toNum(r.total_start),
+      setting_mean: toNum(r.setting_mean),
       max_medals: toNum(r.max_medals),
       diff_medals: toNum(r.diff_medals),
     }});
@@ -443,28 +601,32 @@ function render() {{
   document.getElementById("note").textContent = noteText(metric, rows);
 
   const ranking = buildRanking(rows, metric, plusOk);
+  // 設定推測は累計スタートが取れている日だけ。1件も無ければ列ごと出さない
+  const hasSetting = ranking.some(r => r.setting_mean !== null);
 
   let html = "<table><thead><tr>";
   html += "<th>順位</th><th>台番号</th><th>機種</th>";
   html += `<th>${{metric === "diff_medals" ? "差枚" : "最大持玉"}}</th>`;
   html += "<th>BB</th><th>RB</th><th>AT/ART</th><th>累計</th>";
+  if (hasSetting) html += "<th>推定設定</th>";
   html += "</tr></thead><tbody>";
 
   if (ranking.length === 0) {{
-    html += `<tr><td colspan="8" class="small">該当データなし（この指標が全てnull、またはプラスだけで絞り込み）</td></tr>`;
+    html += `<tr><td colspan="${{hasSetting ? 9 : 8}}" class="small">該当データなし（この指標が全てnull、またはプラスだけで絞り込み）</td></tr>`;
   }} else {{
     const topN = Math.min(50, ranking.length);
     for (let i=0;i<topN;i++) {{
       const r = ranking[i];
       html += "<tr>";
       html += `<td class="num">${{i+1}}</td>`;
-      html += `<td>${{esc(r.machine_id)}}</td>`;
+      html += `<td><a href="unit/${{esc(r.machine_id)}}.html">${{esc(r.machine_id)}}</a></td>`;
       html += `<td>${{esc(r.machine_name)}}</td>`;
-      html += `<td class="num">${{esc(r.value)}}</td>`;
+      html += `<td class="num">${{r.estimated ? "≈" : ""}}${{esc(r.value)}}</td>`;
       html += `<td class="num">${{r.bb ?? ""}}</td>`;
       html += `<td class="num">${{r.rb ?? ""}}</td>`;
       html += `<td class="num">${{r.art ?? ""}}</td>`;
       html += `<td class="num">${{r.total_start ?? ""}}</td>`;
+      if (hasSetting) html += `<td class="num">${{r.setting_mean ?? ""}}</td>`;
       html += "</tr>";
     }}
   }}
@@ -494,15 +656,252 @@ init();
 
 </body></html>
 """
-    (DOCS_DIR / "ranking.html").write_text(html, encoding="utf-8")
+    return html
+
+
+def render_event_pages(records: list[dict], css_href: str, event_index: dict[str, list[str]]) -> dict[str, str]:
+    """イベント日 vs 通常日。集計はビルド時に済ませて、ブラウザには集計結果だけ渡す。"""
+    result = event_comparisons(records, event_index)
+    events_js = json.dumps({"index": event_index, **result}, ensure_ascii=False)
+    events_content = f"const EVENTS = {events_js};\n"
+    events_src = fingerprint("events.js", events_content)
+    return {
+        events_src: events_content,
+        "events.html": render_events_html(events_src, css_href),
+    }
+
+
+def render_events_html(events_src: str, css_href: str) -> str:
+    html = f"""\
+<!doctype html><html lang="ja"><head>
+<meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
+<title>イベント日 vs 通常日</title>
+<link rel="stylesheet" href="{css_href}">
+</head><body>
+<header><div class="container">
+  <h1>イベント日 vs 通常日</h1>
+  <div class="small"><a href="index.html">← 戻る</a></div>
+</div></header>
+
+<div class="container">
+  <div class="card">
+    <div class="row">
+      <div>
+        <label>イベント
+          <select id="eventSel"></select>
+        </label>
+      </div>
+      <div>
+        <label>集計単位
+          <select id="groupSel">
+            <option value="model">機種</option>
+            <option value="suffix">台番号末尾</option>
+            <option value="unit">台番号</option>
+          </select>
+        </label>
+      </div>
+      <div class="small" id="note"></div>
+    </div>
+  </div>
+
+  <div class="card">
+    <div class="small">差：平均差枚の差（machine4 で取れた差枚のみ。推定差枚は含めない）。差枚が無いものは平均最大持玉の差で、差枚の行の後ろにまとめて並べる。</div>
+    <hr>
+    <div class="table-wrap"><div id="table"></div></div>
+  </div>
+</div>
+
+<script src="{events_src}"></script>
+<script>
+function esc(s) {{
+  return String(s).replaceAll("&","&amp;").replaceAll("<","&lt;").replaceAll(">","&gt;");
+}}
+function cell(v) {{
+  return `<td class="num">${{v ?? ""}}</td>`;
+}}
+
+function render() {{
+  const ev = document.getElementById("eventSel").value;
+  const group = document.getElementById("groupSel").value;
+  const rows = ((EVENTS.tables[ev] || {{}})[group]) || [];
+  const days = Object.keys(EVENTS.index).filter(d => ev === EVENTS.events[0] || EVENTS.index[d].includes(ev));
+  document.getElementById("note").textContent = days.length ? "対象日：" + days.join(", ") : "";
+
+  const label = {{ model: "機種", suffix: "末尾", unit: "台番号" }}[group];
+  let html = "<table><thead><tr>";
+  html += `<th>${{label}}</th><th>イベント日数</th><th>平均差枚</th><th>平均最大持玉</th>`;
+  html += "<th>通常日数</th><th>平均差枚</th><th>平均最大持玉</th><th>差</th>";
+  html += "</tr></thead><tbody>";
+
+  if (rows.length === 0) {{
+    html += `<tr><td colspan="8" class="small">該当データなし（data/events/events.json にイベントを登録してください）</td></tr>`;
+  }}
+  for (const r of rows) {{
+    const key = group === "unit" ? `<a href="unit/${{esc(r.key)}}.html">${{esc(r.key)}}</a>` : esc(r.key);
+    html += `<tr><td>${{key}}</td>`;
+    html += cell(r.event_n) + cell(r.event_diff) + cell(r.event_max);
+    html += cell(r.normal_n) + cell(r.normal_diff) + cell(r.normal_max);
+    const unit = {{ diff_medals: "差枚", max_medals: "最大持玉" }}[r.delta_metric];
+    html += `<td class="num">${{r.delta === null ? "" : esc(r.delta) + (unit ? `（${{unit}}）` : "")}}</td>`;
+    html += "</tr>";
+  }}
+  html += "</tbody></table>";
+  document.getElementById("table").innerHTML = html;
+}}
+
+function init() {{
+  const eventSel = document.getElementById("eventSel");
+  eventSel.innerHTML = EVENTS.events.map(n => `<option value="${{esc(n)}}">${{esc(n)}}</option>`).join("");
+  eventSel.addEventListener("change", render);
+  document.getElementById("groupSel").addEventListener("change", render);
+  render();
+}}
+init();
+</script>
+
+</body></html>
+"""
+    return html
+
+
+# ソースが変わったら詳細ページは全部作り直す（テンプレート変更の取りこぼし防止）
+BUILD_KEY = hashlib.sha256(
+    Path(__file__).read_bytes() + Path(detail_pages.__file__).read_bytes()
+).hexdigest()
+
+
+def input_hash(*parts) -> str:
+    return content_hash(json.dumps([BUILD_KEY, *parts], ensure_ascii=False, sort_keys=True))
+
+
+def render_detail_pages(records: list[dict], css_href: str, manifest: dict):
+    """
+    台別・機種別ページ。ページごとに入力（その台/機種の行）のハッシュをマニフェストに残し、
+    前回から入力が変わったページだけをプロセスプールで描画する。
+    戻り値：(描画したページ, 描画を省いたページ -> 前回のファイルハッシュ, ページ -> 入力ハッシュ)
+    """
+    by_unit: dict[str, list[dict]] = {}
+    by_model: dict[str, list[dict]] = {}
+    for r in records:
+        by_unit.setdefault(r["machine_id"], []).append(r)
+        by_model.setdefault(r["machine_name"], []).append(r)
+
+    jobs = [(unit_page_name(k), "unit", k, rows, css_href) for k, rows in by_unit.items()]
+    jobs += [(model_page_name(k), "model", k, rows, css_href) for k, rows in by_model.items()]
+
+    old_files, old_inputs = manifest["files"], manifest["inputs"]
+    inputs = {}
+    todo = []
+    kept = {}
+    for job in jobs:
+        name, _, key, rows, _ = job
+        inputs[name] = input_hash(key, rows, css_href)
+        if old_inputs.get(name) == inputs[name] and name in old_files and (DOCS_DIR / name).exists():
+            kept[name] = old_files[name]
+        else:
+            todo.append(job)
+
+    outputs = {}
+    if todo:
+        with ProcessPoolExecutor() as ex:
+            for name, html in ex.map(render_detail_page, todo, chunksize=32):
+                outputs[name] = html
+
+    model_units = {k: {r["machine_id"] for r in rows} for k, rows in by_model.items()}
+    outputs["models.html"] = render_models_index_html(model_units, css_href)
+    return outputs, kept, inputs
+
+
+def render_site(records: list[dict], manifest: dict, event_index: dict[str, list[str]]):
+    """docs/ の全ファイルをメモリ上で生成する（ファイル名 -> 中身）。"""
+    css = render_style_css()
+    css_href = fingerprint("style.css", css)
+    outputs = {
+        css_href: css,
+        "index.html": render_index_html(css_href),
+    }
+    outputs.update(render_pages(records, css_href, event_index))
+    outputs.update(render_event_pages(records, css_href, event_index))
+    detail, kept, inputs = render_detail_pages(records, css_href, manifest)
+    outputs.update(detail)
+    return outputs, kept, inputs
+
+
+def load_manifest() -> dict:
+    """
+    {"files": ファイル名 -> sha256, "inputs": 詳細ページ -> 入力ハッシュ,
+     "retired": 前回のビルドで使われなくなったファイル -> sha256}
+    """
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    return {
+        "files": data.get("files") or {},
+        "inputs": data.get("inputs") or {},
+        "retired": data.get("retired") or {},
+    }
+
+
+def write_outputs(outputs: dict[str, str], kept: dict[str, str], inputs: dict[str, str], manifest: dict):
+    """
+    前回ビルドのマニフェスト（ファイル名 -> sha256）と比べて、中身が変わったファイルだけ書く。
+    kept は今回描画を省いた（= 前回のまま残す）ファイル。
+    どちらにも無くなったファイル（古い指紋付きアセット等）は1ビルドだけ retired として残し、
+    キャッシュされた古い HTML からの参照が切れないようにする。削除はその次のビルドで行う。
+    """
+    old = manifest["files"]
+    new = {name: content_hash(content) for name, content in outputs.items()}
+
+    changed = [
+        name for name in outputs
+        if old.get(name) != new[name] or not (DOCS_DIR / name).exists()
+    ]
+    new.update(kept)
+    retired = {name: h for name, h in old.items() if name not in new}
+    stale = [name for name in manifest["retired"] if name not in new and name not in retired]
+
+    def write_one(name: str):
+        path = DOCS_DIR / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(outputs[name], encoding="utf-8")
+
+    with ThreadPoolExecutor() as ex:
+        list(ex.map(write_one, changed))
+    for name in stale:
+        (DOCS_DIR / name).unlink(missing_ok=True)
+
+    if new != old or inputs != manifest["inputs"] or retired != manifest["retired"]:
+        MANIFEST_PATH.write_text(
+            json.dumps(
+                {"files": new, "inputs": inputs, "retired": retired},
+                ensure_ascii=False, indent=2, sort_keys=True,
+            ) + "\n",
+            encoding="utf-8",
+        )
+    return changed, retired, stale
 
 
 def main():
-    df = load_all_rows()
-    write_style_css()
-    build_index_html()
-    build_pages(df)
-    print("Built docs/: index.html heatmap.html ranking.html style.css")
+    records = load_all_records()
+    add_diff_estimates(records)
+    add_setting_estimates(records)
+    manifest = load_manifest()
+    event_index = build_event_index([r["date"] for r in records], load_events())
+    outputs, kept, inputs = render_site(records, manifest, event_index)
+    changed, retired, stale = write_outputs(outputs, kept, inputs, manifest)
+    print(
+        f"Built docs/: written={len(changed)} retired={len(retired)} removed={len(stale)} "
+        f"unchanged={len(outputs) - len(changed) + len(kept)} (skipped render: {len(kept)})"
+    )
+    for name in changed:
+        print("  write:", name)
+    for name in retired:
+        print("  retire:", name)
+    for name in stale:
+        print("  remove:", name)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 import json
 import re
+import sys
 import time
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 from urllib.request import Request
@@ -10,6 +11,8 @@ from urllib.request import build_opener, HTTPCookieProcessor
 
 from bs4 import BeautifulSoup
 
+from snapshot_store import JST, append_snapshot, log_path
+
 OUT_DIR = Path("data/daily")
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -19,6 +22,11 @@ MACHINE4_URL = "https://reitoweb.com/b_moba/doc/machine4.php"
 H = "2"
 T = "29"  # 1000/47枚S
 
+# machine4 がこの回数連続で取れなければ停止中とみなし、以降は MACHINE4_PROBE_EVERY 台に1回だけ試す
+# （1台でも取れたら全台に戻す）。試さなかった台は差枚なし
+MACHINE4_GIVE_UP = 20
+MACHINE4_PROBE_EVERY = 10
+
 CJ = CookieJar()
 OPENER = build_opener(HTTPCookieProcessor(CJ))
 
@@ -213,10 +221,7 @@ def fetch_machine4_for_unit(m: str, n: str, referer_machine_php: str, retry=2) -
     return None
 
 
-def main():
-    today = date.today().isoformat()
-    out_path = OUT_DIR / f"{today}.json"
-
+def collect_rows(today: str) -> list[dict]:
     print("OPEN:", NEWS_URL)
     news_html = http_get(NEWS_URL)
     links = get_data_links(news_html)
@@ -225,6 +230,7 @@ def main():
     all_rows = []
     filled_diff_total = 0
     skipped_machine4_total = 0
+    machine4_failures = 0
 
     for idx, data_url in enumerate(links, start=1):
         qs = parse_qs(urlparse(data_url).query)
@@ -271,14 +277,28 @@ def main():
                 "m": m,
             }
 
-            # ★次に machine4 が取れたら diff を上書き
+            # ★次に machine4 が取れたら diff を上書き（停止中は間引いて試す）
+            machine4_down = machine4_failures >= MACHINE4_GIVE_UP
+            if machine4_down and (machine4_failures - MACHINE4_GIVE_UP) % MACHINE4_PROBE_EVERY != 0:
+                skipped_here += 1
+                skipped_machine4_total += 1
+                machine4_failures += 1
+                all_rows.append(item)
+                continue
+
             data = fetch_machine4_for_unit(m, n, referer_machine_php=machine_php_url)
             if not data:
                 skipped_here += 1
                 skipped_machine4_total += 1
                 all_rows.append(item)
+                machine4_failures += 1
+                if machine4_failures == MACHINE4_GIVE_UP:
+                    print(f"machine4: {machine4_failures} failures in a row, probing every {MACHINE4_PROBE_EVERY} units")
                 time.sleep(0.1)
                 continue
+            if machine4_failures >= MACHINE4_GIVE_UP:
+                print("machine4: recovered")
+            machine4_failures = 0
 
             diff = extract_last_diff_from_dataarray(data.get("dataArray"))
             item["diff_medals"] = diff
@@ -301,11 +321,36 @@ def main():
             f"skipped_machine4={skipped_here} url={data_url}"
         )
 
-    out_path.write_text(json.dumps(all_rows, ensure_ascii=False, indent=2), encoding="utf-8")
     print(
-        f"Saved: {out_path} ({len(all_rows)} records) filled_diff_total={filled_diff_total} "
+        f"Collected: {len(all_rows)} records filled_diff_total={filled_diff_total} "
         f"skipped_machine4_total={skipped_machine4_total}"
     )
+    return all_rows
+
+
+def main():
+    # --snapshot: 日中の途中経過。daily/<date>.json は触らず、snapshots/<date>.jsonl に差分だけ追記する
+    if "--snapshot" in sys.argv[1:]:
+        now = datetime.now(JST)
+        today = now.date().isoformat()
+        all_rows = collect_rows(today)
+        entry = append_snapshot(today, all_rows, now)
+        if not all_rows:
+            print("Snapshot: nothing collected, skipped")
+        elif entry is None:
+            print(f"Snapshot: no changes ({log_path(today)})")
+        else:
+            print(
+                f"Snapshot: {log_path(today)} changed_units={len(entry['set'])} "
+                f"removed={len(entry.get('del', []))}"
+            )
+        return
+
+    today = date.today().isoformat()
+    out_path = OUT_DIR / f"{today}.json"
+    all_rows = collect_rows(today)
+    out_path.write_text(json.dumps(all_rows, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Saved: {out_path} ({len(all_rows)} records)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,277 @@
+"""
+台ごと（unit/<台番号>.html）・機種ごと（model/<slug>.html）の詳細ページ。
+build_site.py からプロセスプールで呼ばれるので、ここの関数は引数だけで完結させる。
+"""
+import hashlib
+from html import escape
+
+UNIT_DIR = "unit"
+MODEL_DIR = "model"
+
+
+def model_slug(machine_name: str) -> str:
+    # 機種名は全角・記号だらけなのでファイル名にはハッシュを使う
+    return hashlib.sha256(machine_name.encode("utf-8")).hexdigest()[:10]
+
+
+def unit_page_name(machine_id: str) -> str:
+    return f"{UNIT_DIR}/{machine_id}.html"
+
+
+def model_page_name(machine_name: str) -> str:
+    return f"{MODEL_DIR}/{model_slug(machine_name)}.html"
+
+
+def num(v):
+    """NaN / None -> None、整数値の float -> int"""
+    if v is None or v != v:
+        return None
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    return v
+
+
+def fmt(v) -> str:
+    v = num(v)
+    return "" if v is None else str(v)
+
+
+def fmt_rate(start, count) -> str:
+    """確率表記（1/xxx.x）。累計スタートが取れていない日は空。"""
+    start, count = num(start), num(count)
+    if not start or not count:
+        return ""
+    return f"1/{start / count:.1f}"
+
+
+def fmt_diff(r: dict) -> str:
+    """推定差枚には ≈ を付ける"""
+    v = fmt(r["diff_medals"])
+    return "≈" + v if v and r.get("diff_estimated") else v
+
+
+def pick_metric(rows: list[dict]) -> str:
+    # ヒートマップの auto と同じ：（推定でない）差枚が1つでもあれば差枚、なければ最大持玉
+    real = any(num(r["diff_medals"]) is not None and not r.get("diff_estimated") for r in rows)
+    return "diff_medals" if real else "max_medals"
+
+
+def metric_label(metric: str) -> str:
+    return "差枚" if metric == "diff_medals" else "最大持玉"
+
+
+def total(rows: list[dict], col: str):
+    vals = [num(r[col]) for r in rows if num(r[col]) is not None]
+    return sum(vals) if vals else None
+
+
+def rate_totals(rows: list[dict]):
+    """確率計算用の (累計, BB, RB) 合計。累計が取れている日だけで数える。"""
+    rows = [r for r in rows if num(r["total_start"])]
+    return total(rows, "total_start"), total(rows, "bb") or 0, total(rows, "rb") or 0
+
+
+def trend_svg(rows: list[dict], metric: str) -> str:
+    """日付順の棒グラフ（プラス=赤系、マイナス=青系。ヒートマップの配色に合わせる）"""
+    vals = [num(r[metric]) for r in rows]
+    max_abs = max([abs(v) for v in vals if v is not None], default=0)
+    if max_abs <= 0:
+        return '<div class="small">推移を描ける値がありません。</div>'
+
+    bar_w, gap, height = 24, 6, 120
+    mid = height / 2 if metric == "diff_medals" else height
+    scale = (height / 2 if metric == "diff_medals" else height) / max_abs
+    width = len(vals) * (bar_w + gap)
+    parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" role="img">']
+    parts.append(f'<line x1="0" y1="{mid}" x2="{width}" y2="{mid}" stroke="#1f2937"/>')
+    for i, (r, v) in enumerate(zip(rows, vals)):
+        if v is None:
+            continue
+        h = abs(v) * scale
+        y = mid - h if v >= 0 else mid
+        color = "rgb(255,140,140)" if v >= 0 else "rgb(140,140,255)"
+        x = i * (bar_w + gap)
+        parts.append(
+            f'<rect x="{x}" y="{y:.1f}" width="{bar_w}" height="{h:.1f}" fill="{color}">'
+            f"<title>{escape(r['date'])}: {v}</title></rect>"
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def page(title: str, css_href: str, back_href: str, body: str) -> str:
+    return f"""\
+<!doctype html><html lang="ja"><head>
+<meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="{css_href}">
+</head><body>
+<header><div class="container">
+  <h1>{escape(title)}</h1>
+  <div class="small"><a href="{back_href}">← 戻る</a></div>
+</div></header>
+
+<div class="container">
+{body}
+</div>
+</body></html>
+"""
+
+
+def render_unit_html(machine_id: str, rows: list[dict], css_href: str) -> str:
+    rows = sorted(rows, key=lambda r: r["date"])
+    metric = pick_metric(rows)
+    latest = rows[-1]
+    bb, rb = total(rows, "bb"), total(rows, "rb")
+    start, rate_bb, rate_rb = rate_totals(rows)
+
+    summary = f"""\
+  <div class="card">
+    <div class="row">
+      <span class="badge">機種：<a href="../{model_page_name(latest["machine_name"])}">{escape(latest["machine_name"])}</a></span>
+      <span class="badge">{len(rows)}日分</span>
+      <span class="badge">BB {fmt(bb)} / RB {fmt(rb)}</span>
+      <span class="badge">BB確率 {fmt_rate(start, rate_bb) or "-"}</span>
+      <span class="badge">RB確率 {fmt_rate(start, rate_rb) or "-"}</span>
+      <span class="badge">合成 {fmt_rate(start, rate_bb + rate_rb) or "-"}</span>
+    </div>
+  </div>
+"""
+
+    trend = f"""\
+  <div class="card">
+    <div class="small">推移：{metric_label(metric)}{"（推定差枚を含む）" if metric == "diff_medals" and any(r.get("diff_estimated") for r in rows) else ""}</div>
+    <hr>
+    {trend_svg(rows, metric)}
+  </div>
+"""
+
+    # 設定推測は累計スタートが取れている日だけなので、1日も無ければ列ごと出さない
+    has_setting = any(r.get("setting_mean") is not None for r in rows)
+    body_rows = []
+    for r in reversed(rows):
+        setting_td = f'<td class="num">{fmt(r.get("setting_mean"))}</td>' if has_setting else ""
+        body_rows.append(
+            "<tr>"
+            f"<td>{escape(r['date'])}</td>"
+            f"<td>{escape(r['machine_name'])}</td>"
+            f'<td class="num">{fmt(r["bb"])}</td>'
+            f'<td class="num">{fmt(r["rb"])}</td>'
+            f'<td class="num">{fmt(r["art"])}</td>'
+            f'<td class="num">{fmt(r["total_start"])}</td>'
+            f'<td class="num">{fmt_rate(r["total_start"], r["bb"])}</td>'
+            f'<td class="num">{fmt_rate(r["total_start"], r["rb"])}</td>'
+            f"{setting_td}"
+            f'<td class="num">{fmt(r["max_medals"])}</td>'
+            f'<td class="num">{fmt_diff(r)}</td>'
+            "</tr>"
+        )
+    body_rows = "\n".join(body_rows)
+    setting_th = "<th>推定設定</th>" if has_setting else ""
+    history = f"""\
+  <div class="card">
+    <div class="table-wrap"><table><thead><tr>
+      <th>日付</th><th>機種</th><th>BB</th><th>RB</th><th>AT/ART</th><th>累計</th>
+      <th>BB確率</th><th>RB確率</th>{setting_th}<th>最大持玉</th><th>差枚</th>
+    </tr></thead><tbody>
+{body_rows}
+    </tbody></table></div>
+  </div>
+"""
+    return page(f"台番号 {machine_id}", css_href, "../heatmap.html", summary + trend + history)
+
+
+def render_model_html(machine_name: str, rows: list[dict], css_href: str) -> str:
+    metric = pick_metric(rows)
+
+    by_unit: dict[str, list[dict]] = {}
+    by_date: dict[str, list[dict]] = {}
+    for r in rows:
+        by_unit.setdefault(r["machine_id"], []).append(r)
+        by_date.setdefault(r["date"], []).append(r)
+
+    unit_rows = []
+    for machine_id in sorted(by_unit):
+        urows = sorted(by_unit[machine_id], key=lambda r: r["date"])
+        bb, rb = total(urows, "bb"), total(urows, "rb")
+        start, rate_bb, rate_rb = rate_totals(urows)
+        unit_rows.append(
+            "<tr>"
+            f'<td><a href="../{unit_page_name(machine_id)}">{escape(machine_id)}</a></td>'
+            f'<td class="num">{len(urows)}</td>'
+            f'<td class="num">{fmt(bb)}</td>'
+            f'<td class="num">{fmt(rb)}</td>'
+            f'<td class="num">{fmt_rate(start, rate_bb + rate_rb)}</td>'
+            f'<td class="num">{fmt(total(urows, metric))}</td>'
+            f'<td class="num">{fmt_diff(urows[-1]) if metric == "diff_medals" else fmt(urows[-1][metric])}</td>'
+            "</tr>"
+        )
+
+    date_rows = []
+    for d in sorted(by_date, reverse=True):
+        drows = by_date[d]
+        vals = [num(r[metric]) for r in drows if num(r[metric]) is not None]
+        avg = f"{sum(vals) / len(vals):.1f}" if vals else ""
+        date_rows.append(
+            "<tr>"
+            f"<td>{escape(d)}</td>"
+            f'<td class="num">{len(drows)}</td>'
+            f'<td class="num">{fmt(total(drows, "bb"))}</td>'
+            f'<td class="num">{fmt(total(drows, "rb"))}</td>'
+            f'<td class="num">{avg}</td>'
+            f'<td class="num">{fmt(total(drows, metric))}</td>'
+            "</tr>"
+        )
+
+    label = metric_label(metric)
+    date_rows, unit_rows = "\n".join(date_rows), "\n".join(unit_rows)
+    body = f"""\
+  <div class="card">
+    <div class="small">日別（{label}）</div>
+    <hr>
+    <div class="table-wrap"><table><thead><tr>
+      <th>日付</th><th>台数</th><th>BB合計</th><th>RB合計</th><th>平均{label}</th><th>合計{label}</th>
+    </tr></thead><tbody>
+{date_rows}
+    </tbody></table></div>
+  </div>
+
+  <div class="card">
+    <div class="small">台別（{label}）</div>
+    <hr>
+    <div class="table-wrap"><table><thead><tr>
+      <th>台番号</th><th>日数</th><th>BB合計</th><th>RB合計</th><th>合成確率</th><th>合計{label}</th><th>最新{label}</th>
+    </tr></thead><tbody>
+{unit_rows}
+    </tbody></table></div>
+  </div>
+"""
+    return page(machine_name, css_href, "../models.html", body)
+
+
+def render_models_index_html(model_units: dict[str, set], css_href: str) -> str:
+    items = []
+    for name in sorted(model_units):
+        items.append(
+            "<tr>"
+            f'<td><a href="{model_page_name(name)}">{escape(name)}</a></td>'
+            f'<td class="num">{len(model_units[name])}</td>'
+            "</tr>"
+        )
+    items = "\n".join(items)
+    body = f"""\
+  <div class="card">
+    <div class="table-wrap"><table><thead><tr><th>機種</th><th>台数</th></tr></thead><tbody>
+{items}
+    </tbody></table></div>
+  </div>
+"""
+    return page("機種一覧", css_href, "index.html", body)
+
+
+def render_detail_page(job: tuple) -> tuple[str, str]:
+    """プロセスプール用：(ファイル名, 種別, キー, 行, css_href) -> (ファイル名, HTML)"""
+    name, kind, key, rows, css_href = job
+    if kind == "unit":
+        return name, render_unit_html(key, rows, "../" + css_href)
+    return name, render_model_html(key, rows, "../" + css_href)
@@ -0,0 +1,50 @@
+"""
+machine4 が取れなかった日の差枚推定。
+BB/RB/AT 回数と累計スタートから、機種ごとの払い出し定数で差枚を列単位でまとめて計算する。
+"""
+import numpy as np
+
+# 機種ごとの定数（概算）
+#   bb / rb / art : ボーナス・AT 1回あたりの純増枚数
+#   spin_loss     : 通常時1ゲームあたりの純減枚数（3枚掛け - 小役の払い出し）
+PAYOUT_TABLE = {
+    "ネオアイムジャグラーＥＸ": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.45},
+    "ゴーゴージャグラー３": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.40},
+    "ハッピージャグラーＶＩＩＩ": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.42},
+    "ウルトラミラクルジャグラー": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.43},
+    "ジャグラーガールズＳＳ": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.42},
+    "ＳアイムジャグラーＥＸ": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.45},
+    "ＳマイジャグラーＶ": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.40},
+    "Ｓファンキージャグラー２ＫＴ": {"bb": 240, "rb": 96, "art": 0, "spin_loss": 1.43},
+}
+
+
+def estimate_diff(machine_names, bb, rb, art, total_start, table=PAYOUT_TABLE):
+    """
+    列（同じ長さの配列）から推定差枚 (N,) を返す。
+      diff ≈ bb*BB純増 + rb*RB純増 + art*AT純増 - total_start*通常時純減
+    テーブルに無い機種・累計が取れていない行は NaN。AT 回数は欠損なら 0 とみなす。
+    """
+    names = list(table)
+    consts = np.array(
+        [[table[n]["bb"], table[n]["rb"], table[n]["art"], table[n]["spin_loss"]] for n in names],
+        dtype=float,
+    ).reshape(-1, 4)
+    index = {n: i for i, n in enumerate(names)}
+
+    model = np.array([index.get(n, -1) for n in machine_names], dtype=np.int64)
+    bb = np.asarray(bb, dtype=float)
+    rb = np.asarray(rb, dtype=float)
+    art = np.nan_to_num(np.asarray(art, dtype=float))
+    n = np.asarray(total_start, dtype=float)
+
+    ok = (model >= 0) & (n > 0) & (bb >= 0) & (rb >= 0)
+    diff = np.full(len(model), np.nan)
+    if not ok.any():
+        return diff
+
+    c = consts[model[ok]]
+    diff[ok] = np.round(
+        bb[ok] * c[:, 0] + rb[ok] * c[:, 1] + art[ok] * c[:, 2] - n[ok] * c[:, 3]
+    )
+    return diff
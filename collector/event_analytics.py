@@ -0,0 +1,140 @@
+"""
+イベント日の集計。
+data/events/events.json のカレンダーを日付に展開（インデックス化）して、
+イベント日 vs 通常日 を機種別・台番号末尾別・台別に比較する。
+
+events.json の形式（どれか1つのキーで日付を指定）：
+  {"name": "7のつく日", "day_suffix": 7}       日の1の位（7, 17, 27日）
+  {"name": "毎月1日", "day_of_month": 1}       日付（月内）
+  {"name": "周年", "date": "2026-03-01"}       特定日
+"""
+import json
+from datetime import date
+from pathlib import Path
+
+EVENTS_PATH = Path("data/events/events.json")
+
+ALL_EVENTS = "イベント日（全体）"
+GROUPS = {
+    "model": "machine_name",
+    "suffix": "suffix",
+    "unit": "machine_id",
+}
+
+
+def normalize_event(e) -> dict | None:
+    """日付指定を正規化したイベント。名前が無い・日付指定が読めないものは None（読み飛ばす）。"""
+    if not isinstance(e, dict) or not e.get("name"):
+        return None
+    try:
+        if "date" in e:
+            return {"name": e["name"], "date": date.fromisoformat(str(e["date"])).isoformat()}
+        if "day_of_month" in e:
+            day = int(e["day_of_month"])
+            return {"name": e["name"], "day_of_month": day} if 1 <= day <= 31 else None
+        if "day_suffix" in e:
+            suffix = int(e["day_suffix"])
+            return {"name": e["name"], "day_suffix": suffix} if 0 <= suffix <= 9 else None
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def load_events(path: Path = EVENTS_PATH) -> list[dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+    if not isinstance(data, list):
+        return []
+    return [e for e in map(normalize_event, data) if e]
+
+
+def event_matches(event: dict, d: str) -> bool:
+    """event は load_events で正規化済みのもの"""
+    day = int(d[8:10])
+    if "date" in event:
+        return event["date"] == d
+    if "day_of_month" in event:
+        return event["day_of_month"] == day
+    if "day_suffix" in event:
+        return event["day_suffix"] == day % 10
+    return False
+
+
+def build_event_index(dates, events: list[dict]) -> dict[str, list[str]]:
+    """日付 -> その日に当たるイベント名。イベントの無い日は入れない。"""
+    index = {}
+    for d in sorted(set(dates)):
+        names = [e["name"] for e in events if event_matches(e, d)]
+        if names:
+            index[d] = names
+    return index
+
+
+def event_comparisons(records: list[dict], index: dict[str, list[str]]) -> dict:
+    """
+    イベントごとに、イベント日/通常日の 日数・平均差枚・平均最大持玉 を groupby でまとめて出す。
+    平均差枚は machine4 で取れた差枚だけ（推定差枚 diff_estimated は使わない）。
+    delta は平均差枚の差、差枚が無い組は平均最大持玉の差で、どちらかを delta_metric に入れる。
+    並びは delta_metric ごと（差枚 -> 最大持玉）に delta の大きい順。
+    戻り値：{"events": [...], "tables": {イベント名: {"model"|"suffix"|"unit": [行...]}}}
+    """
+    if not records or not index:
+        return {"events": [], "tables": {}}
+
+    import pandas as pd
+
+    df = pd.DataFrame(
+        records, columns=["date", "machine_id", "machine_name", "diff_medals", "diff_estimated", "max_medals"]
+    )
+    df["diff_medals"] = df["diff_medals"].where(df["diff_estimated"].ne(True))
+    df["suffix"] = df["machine_id"].str[-1]
+
+    pairs = pd.DataFrame(
+        [(d, name) for d, names in index.items() for name in names], columns=["date", "event"]
+    )
+    event_dates = {name: set(g["date"]) for name, g in pairs.groupby("event", sort=False)}
+    event_dates = {ALL_EVENTS: set(index), **event_dates}
+
+    tables = {}
+    for name, dates in event_dates.items():
+        df["is_event"] = df["date"].isin(dates)
+        tables[name] = {}
+        for group, col in GROUPS.items():
+            agg = (
+                df.groupby([col, "is_event"])
+                .agg(n=("date", "nunique"), diff=("diff_medals", "mean"), max=("max_medals", "mean"))
+                .unstack("is_event")
+            )
+            # 片方（イベント日 or 通常日）しか無いグループは比較できないので落とす
+            agg = agg.reindex(columns=pd.MultiIndex.from_product([["n", "diff", "max"], [True, False]]))
+            agg = agg[agg[("n", True)].notna() & agg[("n", False)].notna()]
+
+            out = pd.DataFrame(
+                {
+                    "key": agg.index.astype(str),
+                    "event_n": agg[("n", True)].astype(int).to_numpy(),
+                    "event_diff": agg[("diff", True)].to_numpy(),
+                    "event_max": agg[("max", True)].to_numpy(),
+                    "normal_n": agg[("n", False)].astype(int).to_numpy(),
+                    "normal_diff": agg[("diff", False)].to_numpy(),
+                    "normal_max": agg[("max", False)].to_numpy(),
+                }
+            )
+            diff_delta = out["event_diff"] - out["normal_diff"]
+            max_delta = out["event_max"] - out["normal_max"]
+            out["delta"] = diff_delta.fillna(max_delta)
+            out["delta_metric"] = None
+            out.loc[max_delta.notna(), "delta_metric"] = "max_medals"
+            out.loc[diff_delta.notna(), "delta_metric"] = "diff_medals"
+            rank = out["delta_metric"].map({"diff_medals": 0, "max_medals": 1}).fillna(2)
+            out = (
+                out.assign(_rank=rank)
+                .sort_values(["_rank", "delta"], ascending=[True, False], na_position="last")
+                .drop(columns="_rank")
+                .round(1)
+            )
+            out = out.astype(object).where(out.notna(), None)
+            tables[name][group] = out.to_dict(orient="records")
+    return {"events": list(event_dates), "tables": tables}
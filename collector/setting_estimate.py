@@ -0,0 +1,89 @@
+"""
+ジャグラー系の設定推測。
+BB/RB 回数と累計スタートから、台×日ごとに設定1〜6の事後確率をまとめて（列単位で）計算する。
+"""
+import numpy as np
+
+SETTINGS = [1, 2, 3, 4, 5, 6]
+
+# 機種ごとの BB / RB 確率の分母（設定1〜6、公表値ベース）
+# ここに無い機種は推測しない（setting_mean を付けない）。新しいジャグラーを入れたら追加する
+SETTING_TABLES = {
+    "ネオアイムジャグラーＥＸ": {
+        "bb": [273.1, 269.7, 269.7, 259.0, 259.0, 255.0],
+        "rb": [439.8, 399.6, 331.0, 315.1, 255.0, 255.0],
+    },
+    "ゴーゴージャグラー３": {
+        "bb": [259.0, 258.0, 257.0, 254.0, 247.3, 234.9],
+        "rb": [354.2, 332.7, 306.2, 268.6, 247.3, 234.9],
+    },
+    "ハッピージャグラーＶＩＩＩ": {
+        "bb": [273.1, 270.8, 263.2, 254.0, 239.2, 226.0],
+        "rb": [397.2, 362.1, 332.7, 300.6, 273.1, 256.0],
+    },
+    "ウルトラミラクルジャグラー": {
+        "bb": [267.5, 261.1, 256.0, 242.7, 233.2, 216.3],
+        "rb": [425.6, 402.1, 350.5, 322.8, 297.9, 277.7],
+    },
+    "ジャグラーガールズＳＳ": {
+        "bb": [273.1, 270.8, 260.1, 250.1, 243.6, 226.0],
+        "rb": [381.0, 350.5, 316.6, 281.3, 270.8, 252.1],
+    },
+    "ＳアイムジャグラーＥＸ": {
+        "bb": [273.1, 269.7, 269.7, 259.0, 259.0, 255.0],
+        "rb": [439.8, 399.6, 331.0, 315.1, 255.0, 255.0],
+    },
+    "ＳマイジャグラーＶ": {
+        "bb": [273.1, 270.8, 266.4, 254.0, 240.9, 229.1],
+        "rb": [409.6, 385.5, 336.1, 290.0, 268.6, 229.1],
+    },
+    "Ｓファンキージャグラー２ＫＴ": {
+        "bb": [266.4, 259.0, 256.0, 249.2, 240.9, 219.9],
+        "rb": [439.8, 407.1, 366.1, 322.8, 299.3, 262.1],
+    },
+}
+
+# 事前分布（設定ごと）。ホールの設定配分が分かれば差し替える
+PRIOR = np.full(len(SETTINGS), 1 / len(SETTINGS))
+
+
+def estimate_settings(machine_names, bb, rb, total_start, tables=SETTING_TABLES, prior=PRIOR):
+    """
+    列（同じ長さの配列）を受け取って、設定ごとの事後確率 (N, 6) と設定期待値 (N,) を返す。
+    テーブルに無い機種・累計が取れていない行・回数が矛盾する行は NaN。
+
+    尤度は1回転ごとに BB / RB / ハズレ の多項分布：
+      log L(s) = bb*log p_bb(s) + rb*log p_rb(s) + (n - bb - rb)*log(1 - p_bb(s) - p_rb(s))
+    """
+    names = list(tables)
+    p_bb = np.array([[1 / x for x in tables[n]["bb"]] for n in names]).reshape(-1, len(SETTINGS))
+    p_rb = np.array([[1 / x for x in tables[n]["rb"]] for n in names]).reshape(-1, len(SETTINGS))
+    index = {n: i for i, n in enumerate(names)}
+
+    model = np.array([index.get(n, -1) for n in machine_names], dtype=np.int64)
+    bb = np.asarray(bb, dtype=float)
+    rb = np.asarray(rb, dtype=float)
+    n = np.asarray(total_start, dtype=float)
+    miss = n - bb - rb
+
+    ok = (model >= 0) & (n > 0) & (bb >= 0) & (rb >= 0) & (miss >= 0)
+    probs = np.full((len(model), len(SETTINGS)), np.nan)
+    mean = np.full(len(model), np.nan)
+    if not ok.any():
+        return probs, mean
+
+    m = model[ok]
+    pb, pr = p_bb[m], p_rb[m]
+    loglik = (
+        bb[ok, None] * np.log(pb)
+        + rb[ok, None] * np.log(pr)
+        + miss[ok, None] * np.log1p(-(pb + pr))
+        + np.log(prior)
+    )
+    loglik -= loglik.max(axis=1, keepdims=True)
+    post = np.exp(loglik)
+    post /= post.sum(axis=1, keepdims=True)
+
+    probs[ok] = post
+    mean[ok] = post @ np.array(SETTINGS, dtype=float)
+    return probs, mean
@@ -0,0 +1,113 @@
+"""
+日中スナップショットの差分ログ（data/snapshots/<date>.jsonl）。
+1行 = 1スナップショットで、前回から変わった台・項目だけを持つ：
+  {"t": "2026-02-14T15:00:00+09:00", "set": {"0729": {"bb": 15, "max_medals": 1100}}, "del": ["0801"]}
+その日の最初のスナップショットは全台・全項目が "set" に入る。
+任意の時点のデータは、その時刻までの行を順に当て直して復元する。
+"""
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+SNAPSHOT_DIR = Path("data/snapshots")
+JST = timezone(timedelta(hours=9))
+KEY = "machine_id"
+
+
+def log_path(day: str) -> Path:
+    return SNAPSHOT_DIR / f"{day}.jsonl"
+
+
+def load_log(day: str) -> list[dict]:
+    path = log_path(day)
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            entries.append(json.loads(line))
+    return entries
+
+
+def parse_time(at, day: str) -> datetime:
+    """datetime / ISO文字列 / "HH:MM" を受け付ける。タイムゾーン無しは JST とみなす。"""
+    if isinstance(at, str):
+        at = datetime.fromisoformat(at if "-" in at else f"{day}T{at}")
+    return at if at.tzinfo else at.replace(tzinfo=JST)
+
+
+def apply_entry(state: dict[str, dict], entry: dict):
+    for key, fields in entry.get("set", {}).items():
+        state.setdefault(key, {KEY: key}).update(fields)
+    for key in entry.get("del", []):
+        state.pop(key, None)
+
+
+def state_at(day: str, at=None) -> dict[str, dict]:
+    """台番号 -> 行。at 以前（at を含む）のスナップショットまでを反映する。at=None なら最新。"""
+    limit = parse_time(at, day) if at is not None else None
+    state: dict[str, dict] = {}
+    for entry in load_log(day):
+        if limit is not None and datetime.fromisoformat(entry["t"]) > limit:
+            break
+        apply_entry(state, entry)
+    return state
+
+
+def rows_at(day: str, at=None) -> list[dict]:
+    """daily/<date>.json と同じ形（行のリスト、台番号順）で返す。"""
+    state = state_at(day, at)
+    return [state[k] for k in sorted(state)]
+
+
+def diff_rows(prev: dict[str, dict], rows: list[dict]) -> tuple[dict, list]:
+    """
+    前回の状態との差分 (set, del)。
+    del にするのは、今回取れた data.php（m）に載っていたのに今回いなくなった台だけ。
+    取得に失敗したページの台は「変化なし」扱い（一時的な失敗を全台削除にしない）。
+    """
+    changed = {}
+    seen = set()
+    pages = {r.get("m") for r in rows}
+    for r in rows:
+        key = r[KEY]
+        seen.add(key)
+        old = prev.get(key, {})
+        fields = {k: v for k, v in r.items() if k != KEY and (k not in old or old[k] != v)}
+        if fields:
+            changed[key] = fields
+    removed = sorted(k for k, old in prev.items() if k not in seen and old.get("m") in pages)
+    return changed, removed
+
+
+def append_snapshot(day: str, rows: list[dict], now: datetime | None = None) -> dict | None:
+    """
+    差分だけを1行追記する。何も変わっていなければ書かない（None を返す）。
+    rows が空（ニュースページや data.php が全部取れなかった）のときも書かない。
+    前回の状態はログを当て直して作るので、コストは日中の変化量に比例する。
+    """
+    if not rows:
+        return None
+    now = now or datetime.now(JST)
+    changed, removed = diff_rows(state_at(day), rows)
+    if not changed and not removed:
+        return None
+
+    entry = {"t": now.isoformat(timespec="seconds"), "set": changed}
+    if removed:
+        entry["del"] = removed
+    path = log_path(day)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return entry
+
+
+if __name__ == "__main__":
+    # python collector/snapshot_store.py 2026-02-14 [15:00]  -> その時点のデータを JSON で出力
+    if len(sys.argv) < 2:
+        print("usage: snapshot_store.py <date> [time]", file=sys.stderr)
+        sys.exit(1)
+    at = sys.argv[2] if len(sys.argv) > 2 else None
+    print(json.dumps(rows_at(sys.argv[1], at), ensure_ascii=False, indent=2))
@@ -0,0 +1,2 @@
+const DATA = {"dates": ["2026-02-11", "2026-02-12", "2026-02-13", "2026-02-14"], "machine_names": ["ウルトラミラクルジャグラー", "ゴーゴージャグラー３", "ジャグラーガールズＳＳ", "ネオアイムジャグラーＥＸ", "ハッピージャグラーＶＩＩＩ", "沖ドキ！ＢＬＡＣＫ", "沖ドキ！ＧＯＬＤ－３０", "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "Ｌいざ！番長", "Ｌうみねこのなく頃に２－Ｖ", "Ｌかぐや様は告らせたい－Ｖ", "Ｌからくりサーカス", "Ｌとある科学超電磁砲２－⑤", "Ｌひぐらしのなく頃に業", "Ｌわたしの幸せな結婚", "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "Ｌアリフレタ職業デ世界最強－Ｖ", "Ｌガールズ＆パンツァー最終", "Ｌギルティクラウン２", "Ｌゴジラ対エヴァンゲリオン－Ｖ", "Ｌゴッドイーター　リザレクション－Ｖ", "ＬゴブリンスレイヤーＩＩ－⑤", "Ｌシャーマンキング－Ｖ", "Ｌスマスロ北斗", "Ｌスーパーブラックジャック", "Ｌソードアート・オンライン", "Ｌダーリン・イン・ザ・フランキス－⑤", "Ｌチバリヨ２プラス", "Ｌデビルメイクライ５スタイリッシュトライブ", "Ｌネオプラネット", "Ｌハナビ", "Ｌバイオハザード５", "Ｌバキ強くなりたくば喰らえ", "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "Ｌバーニングエクスプレス－Ｖ", "Ｌパチスロ　ラブ嬢３　Ｗご指名", "Ｌマギアレコード", "Ｌマクロスフロンティア４", "Ｌマジカルハロウィン８", "ＬモンキーターンＶ", "Ｌモンスターハンターライズ", "Ｌルパン三世　大航海者の秘宝", "Ｌ主役は銭形５", "Ｌ化物語", "Ｌ北斗　転生の章２", "Ｌ吉宗", "Ｌ咲－Ｓａｋｉ－頂上決戦", "Ｌ回胴黙示録カイジ　狂宴", "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "Ｌ忍魂参　奥義皆伝ノ章", "Ｌ戦国乙女４", "Ｌ押忍！番長４", "Ｌ攻殻機動隊－Ｖ", "Ｌ新鬼武者３", "Ｌ東京リベンジャーズ", "Ｌ東京喰種", "Ｌ沖ドキ！ＤＵＯ　アンコール", "Ｌ炎炎ノ消防隊", "Ｌ炎炎ノ消防隊２", "Ｌ無職転生－Ｖ", "Ｌ秘宝伝－５", "Ｌ範馬刃牙－Ｖ", "Ｌ絶対衝激ＩＶ－Ｖ", "Ｌ転生したら剣でした", "Ｌ鉄拳６", "Ｌ防振り", "Ｌ革命機ヴァルヴレイヴ", "Ｌ革命機ヴァルヴレイヴ２", "Ｌ頭文字Ｄ　２ｎｄ", "Ｌ麻雀物語", "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "ＬＢアレックス　ブライト", "ＬＢクレアの秘宝伝", "ＬＢニューキングハナハナＶ", "ＬＢ不二子－Ｖ", "ＳアイムジャグラーＥＸ", "Ｓファンキージャグラー２ＫＴ", "ＳマイジャグラーＶ"], "events": {}};
+DATA.rows = DATA_CHUNKS.flat();
@@ -0,0 +1 @@
+const DATA = {"dates": ["2026-02-11", "2026-02-12", "2026-02-13", "2026-02-14"], "machine_names": ["ウルトラミラクルジャグラー", "ゴーゴージャグラー３", "ジャグラーガールズＳＳ", "ネオアイムジャグラーＥＸ", "ハッピージャグラーＶＩＩＩ", "沖ドキ！ＢＬＡＣＫ", "沖ドキ！ＧＯＬＤ－３０", "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "Ｌいざ！番長", "Ｌうみねこのなく頃に２－Ｖ", "Ｌかぐや様は告らせたい－Ｖ", "Ｌからくりサーカス", "Ｌとある科学超電磁砲２－⑤", "Ｌひぐらしのなく頃に業", "Ｌわたしの幸せな結婚", "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "Ｌアリフレタ職業デ世界最強－Ｖ", "Ｌガールズ＆パンツァー最終", "Ｌギルティクラウン２", "Ｌゴジラ対エヴァンゲリオン－Ｖ", "Ｌゴッドイーター　リザレクション－Ｖ", "ＬゴブリンスレイヤーＩＩ－⑤", "Ｌシャーマンキング－Ｖ", "Ｌスマスロ北斗", "Ｌスーパーブラックジャック", "Ｌソードアート・オンライン", "Ｌダーリン・イン・ザ・フランキス－⑤", "Ｌチバリヨ２プラス", "Ｌデビルメイクライ５スタイリッシュトライブ", "Ｌネオプラネット", "Ｌハナビ", "Ｌバイオハザード５", "Ｌバキ強くなりたくば喰らえ", "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "Ｌバーニングエクスプレス－Ｖ", "Ｌパチスロ　ラブ嬢３　Ｗご指名", "Ｌマギアレコード", "Ｌマクロスフロンティア４", "Ｌマジカルハロウィン８", "ＬモンキーターンＶ", "Ｌモンスターハンターライズ", "Ｌルパン三世　大航海者の秘宝", "Ｌ主役は銭形５", "Ｌ化物語", "Ｌ北斗　転生の章２", "Ｌ吉宗", "Ｌ咲－Ｓａｋｉ－頂上決戦", "Ｌ回胴黙示録カイジ　狂宴", "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "Ｌ忍魂参　奥義皆伝ノ章", "Ｌ戦国乙女４", "Ｌ押忍！番長４", "Ｌ攻殻機動隊－Ｖ", "Ｌ新鬼武者３", "Ｌ東京リベンジャーズ", "Ｌ東京喰種", "Ｌ沖ドキ！ＤＵＯ　アンコール", "Ｌ炎炎ノ消防隊", "Ｌ炎炎ノ消防隊２", "Ｌ無職転生－Ｖ", "Ｌ秘宝伝－５", "Ｌ範馬刃牙－Ｖ", "Ｌ絶対衝激ＩＶ－Ｖ", "Ｌ転生したら剣でした", "Ｌ鉄拳６", "Ｌ防振り", "Ｌ革命機ヴァルヴレイヴ", "Ｌ革命機ヴァルヴレイヴ２", "Ｌ頭文字Ｄ　２ｎｄ", "Ｌ麻雀物語", "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "ＬＢアレックス　ブライト", "ＬＢクレアの秘宝伝", "ＬＢニューキングハナハナＶ", "ＬＢ不二子－Ｖ", "ＳアイムジャグラーＥＸ", "Ｓファンキージャグラー２ＫＴ", "ＳマイジャグラーＶ"], "rows": [{"date": "2026-02-11", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1037, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1078, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 895, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1703, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1145, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 983, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 933, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 962, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 40, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2737, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1640, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 733, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 33, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 3217, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 2117, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1642, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 38, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 4413, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1648, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 12, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 682, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1392, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 32, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2101, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 823, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 1394, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1493, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 2270, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1432, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1732, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 803, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1386, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1517, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 836, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 681, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 23, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1575, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 34, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 3322, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1277, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 466, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 2008, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1703, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 2561, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1100, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 2830, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 33, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 6479, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 3732, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1866, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 15, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 3098, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2484, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 3208, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2419, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 30, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 2942, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2846, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1974, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1339, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 27, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1471, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1913, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1516, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 2439, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 2163, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 9, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 712, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 760, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2060, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2984, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1301, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 26, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 4544, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 2655, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 35, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 6502, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3080, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 32, "total_start": NaN, "max_medals": 1035, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 64, "total_start": NaN, "max_medals": 5650, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 30, "total_start": NaN, "max_medals": 1501, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 42, "total_start": NaN, "max_medals": 1342, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 31, "total_start": NaN, "max_medals": 1472, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 8, "art": 35, "total_start": NaN, "max_medals": 1950, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 26, "total_start": NaN, "max_medals": 2731, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 40, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 21, "total_start": NaN, "max_medals": 427, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 51, "total_start": NaN, "max_medals": 3849, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 425, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 68, "total_start": NaN, "max_medals": 5353, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 23, "total_start": NaN, "max_medals": 1171, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 36, "total_start": NaN, "max_medals": 1985, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 34, "total_start": NaN, "max_medals": 1215, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 30, "total_start": NaN, "max_medals": 1399, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 33, "total_start": NaN, "max_medals": 5699, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 12, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1377, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 16, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 765, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 294, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1058, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 32, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 3261, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 15, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 942, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 39, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 2124, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 569, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 32, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1585, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1015, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 258, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 31, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1734, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 608, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 11, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 968, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 9, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 460, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 519, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 670, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 65, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2156, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2140, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1148, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 23, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1984, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1257, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 30, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 6791, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1675, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 1190, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 13, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1202, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 13, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2366, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 23, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2250, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1391, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 24, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3296, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 9, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1300, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2341, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 3452, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 28, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 3335, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 35, "total_start": NaN, "max_medals": 1166, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 17, "art": 86, "total_start": NaN, "max_medals": 3114, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 38, "total_start": NaN, "max_medals": 1687, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 12, "art": 31, "total_start": NaN, "max_medals": 918, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 13, "art": 43, "total_start": NaN, "max_medals": 1154, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 18, "art": 48, "total_start": NaN, "max_medals": 1221, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 21, "art": 93, "total_start": NaN, "max_medals": 7213, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 18, "art": 76, "total_start": NaN, "max_medals": 3291, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 40, "total_start": NaN, "max_medals": 1007, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 18, "art": 64, "total_start": NaN, "max_medals": 1729, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 63, "total_start": NaN, "max_medals": 2896, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 6, "art": 14, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 13, "art": 55, "total_start": NaN, "max_medals": 1423, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 81, "total_start": NaN, "max_medals": 4388, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 21, "total_start": NaN, "max_medals": 911, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 92, "total_start": NaN, "max_medals": 7741, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 37, "rb": 4, "art": 16, "total_start": NaN, "max_medals": 3272, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 14, "rb": 3, "art": 10, "total_start": NaN, "max_medals": 1405, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 37, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 3823, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 6, "art": 14, "total_start": NaN, "max_medals": 620, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 38, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1635, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 60, "rb": 2, "art": 17, "total_start": NaN, "max_medals": 3514, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 49, "rb": 8, "art": 22, "total_start": NaN, "max_medals": 4044, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 89, "rb": 3, "art": 14, "total_start": NaN, "max_medals": 9176, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 18, "rb": 4, "art": 21, "total_start": NaN, "max_medals": 955, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 13, "rb": 5, "art": 13, "total_start": NaN, "max_medals": 743, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 20, "rb": 5, "art": 12, "total_start": NaN, "max_medals": 1222, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 48, "rb": 5, "art": 23, "total_start": NaN, "max_medals": 4540, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 105, "rb": 5, "art": 13, "total_start": NaN, "max_medals": 7901, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 70, "rb": 7, "art": 17, "total_start": NaN, "max_medals": 4713, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 29, "total_start": NaN, "max_medals": 1185, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 17, "total_start": NaN, "max_medals": 3637, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 28, "total_start": NaN, "max_medals": 5038, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 16, "art": 38, "total_start": NaN, "max_medals": 5865, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 12, "art": 58, "total_start": NaN, "max_medals": 9675, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 34, "total_start": NaN, "max_medals": 4247, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 37, "total_start": NaN, "max_medals": 4557, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 25, "total_start": NaN, "max_medals": 1533, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 22, "art": 36, "total_start": NaN, "max_medals": 2203, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 24, "art": 22, "total_start": NaN, "max_medals": 746, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 40, "total_start": NaN, "max_medals": 5901, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 21, "art": 34, "total_start": NaN, "max_medals": 2803, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 16, "art": 36, "total_start": NaN, "max_medals": 5309, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 18, "total_start": NaN, "max_medals": 781, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 690, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 481, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 25, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 1959, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 31, "rb": 30, "art": 0, "total_start": NaN, "max_medals": 1557, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 26, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 1209, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 7, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 471, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 30, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 15, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1317, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 16, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 910, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 7, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 430, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 25, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1372, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 20, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 979, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 20, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 911, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 28, "rb": 33, "art": 0, "total_start": NaN, "max_medals": 1075, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 943, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 19, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 961, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 667, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 31, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1455, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 24, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1599, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1263, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 646, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1356, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 890, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1376, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 45, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 6582, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 938, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1438, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 39, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 4811, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2828, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 45, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 5235, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 28, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 2310, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 15, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 923, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 26, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1800, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 45, "total_start": NaN, "max_medals": 5000, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 16, "art": 25, "total_start": NaN, "max_medals": 1859, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 16, "art": 27, "total_start": NaN, "max_medals": 3085, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 39, "total_start": NaN, "max_medals": 1943, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 43, "total_start": NaN, "max_medals": 2539, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 23, "art": 47, "total_start": NaN, "max_medals": 2081, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 13, "art": 28, "total_start": NaN, "max_medals": 5147, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 29, "total_start": NaN, "max_medals": 1038, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 16, "art": 6, "total_start": NaN, "max_medals": 3112, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 39, "rb": 27, "art": 12, "total_start": NaN, "max_medals": 2240, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 10, "rb": 5, "art": 5, "total_start": NaN, "max_medals": 267, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 38, "rb": 49, "art": 10, "total_start": NaN, "max_medals": 9237, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 28, "rb": 62, "art": 10, "total_start": NaN, "max_medals": 10734, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 14, "rb": 10, "art": 9, "total_start": NaN, "max_medals": 795, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 27, "rb": 52, "art": 6, "total_start": NaN, "max_medals": 6622, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 26, "rb": 21, "art": 9, "total_start": NaN, "max_medals": 2350, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 6, "art": 19, "total_start": NaN, "max_medals": 637, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 4, "art": 25, "total_start": NaN, "max_medals": 5392, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 11, "art": 27, "total_start": NaN, "max_medals": 1405, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 4, "art": 6, "total_start": NaN, "max_medals": 420, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 12, "art": 32, "total_start": NaN, "max_medals": 1415, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 891, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 12, "art": 52, "total_start": NaN, "max_medals": 2182, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 181, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 3, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 523, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 12, "rb": 4, "art": 16, "total_start": NaN, "max_medals": 1101, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 4, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 887, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 1, "art": 8, "total_start": NaN, "max_medals": 545, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 6, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 610, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 25, "rb": 7, "art": 25, "total_start": NaN, "max_medals": 1475, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 9, "rb": 3, "art": 16, "total_start": NaN, "max_medals": 1028, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 30, "rb": 5, "art": 18, "total_start": NaN, "max_medals": 5080, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 4, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 548, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 23, "rb": 0, "art": 18, "total_start": NaN, "max_medals": 1637, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 504, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 11, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 493, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 103, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 3, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 260, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 103, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 28, "rb": 0, "art": 46, "total_start": NaN, "max_medals": 4682, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 17, "rb": 0, "art": 36, "total_start": NaN, "max_medals": 4013, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 11, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 339, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 8, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 535, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 50, "rb": 0, "art": 85, "total_start": NaN, "max_medals": 7339, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 5, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 250, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 20, "rb": 0, "art": 16, "total_start": NaN, "max_medals": 614, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 9, "art": 39, "total_start": NaN, "max_medals": 2814, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 9, "art": 41, "total_start": NaN, "max_medals": 2457, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 12, "art": 45, "total_start": NaN, "max_medals": 1605, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 16, "art": 35, "total_start": NaN, "max_medals": 1562, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 20, "art": 73, "total_start": NaN, "max_medals": 4465, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 6, "art": 30, "total_start": NaN, "max_medals": 1184, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 21, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 986, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 938, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 12, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1154, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1107, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 6, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 503, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 24, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 987, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 10, "art": 25, "total_start": NaN, "max_medals": 705, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 4, "art": 21, "total_start": NaN, "max_medals": 1234, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 18, "total_start": NaN, "max_medals": 1064, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 14, "total_start": NaN, "max_medals": 694, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 12, "art": 36, "total_start": NaN, "max_medals": 1618, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 12, "art": 71, "total_start": NaN, "max_medals": 11245, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 18, "art": 53, "total_start": NaN, "max_medals": 2564, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 22, "art": 70, "total_start": NaN, "max_medals": 3817, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 17, "art": 75, "total_start": NaN, "max_medals": 5037, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 25, "art": 74, "total_start": NaN, "max_medals": 2547, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 19, "art": 85, "total_start": NaN, "max_medals": 5609, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 28, "art": 61, "total_start": NaN, "max_medals": 1280, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 4, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 662, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 735, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 25, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 2784, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 1, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 471, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 733, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 4, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 449, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 23, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 967, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 18, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1217, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1042, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 23, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1368, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 21, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 812, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 28, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1623, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 12, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 862, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 8, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 969, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1282, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 10, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 587, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 12, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 589, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 21, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1749, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 15, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1168, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 15, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 736, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 13, "art": 31, "total_start": NaN, "max_medals": 2878, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 24, "art": 38, "total_start": NaN, "max_medals": 7397, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 30, "art": 42, "total_start": NaN, "max_medals": 14809, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 15, "art": 30, "total_start": NaN, "max_medals": 2336, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 21, "total_start": NaN, "max_medals": 3397, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 3, "art": 30, "total_start": NaN, "max_medals": 1569, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 29, "total_start": NaN, "max_medals": 1680, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 28, "total_start": NaN, "max_medals": 1566, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 16, "art": 32, "total_start": NaN, "max_medals": 1047, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 20, "art": 53, "total_start": NaN, "max_medals": 8280, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 19, "art": 36, "total_start": NaN, "max_medals": 2468, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 21, "art": 45, "total_start": NaN, "max_medals": 3546, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 42, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 7648, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 13, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1431, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 17, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 2177, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 24, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2668, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 13, "art": 25, "total_start": NaN, "max_medals": 1504, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 8, "art": 26, "total_start": NaN, "max_medals": 5803, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 4, "art": 5, "total_start": NaN, "max_medals": 675, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 8, "art": 13, "total_start": NaN, "max_medals": 1053, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 18, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1512, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 33, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 2037, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 28, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1563, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 458, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 407, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 17, "art": 56, "total_start": NaN, "max_medals": 4929, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 12, "art": 21, "total_start": NaN, "max_medals": 3522, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 8, "art": 20, "total_start": NaN, "max_medals": 1023, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 11, "art": 25, "total_start": NaN, "max_medals": 3762, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 6, "art": 11, "total_start": NaN, "max_medals": 887, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 7, "art": 14, "total_start": NaN, "max_medals": 780, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 9, "art": 27, "total_start": NaN, "max_medals": 3401, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 9, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 3975, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 1169, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 723, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 6, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 743, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 26, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 2114, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 883, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 348, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 17, "rb": 0, "art": 41, "total_start": NaN, "max_medals": 6222, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 13, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 1738, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 21, "rb": 0, "art": 34, "total_start": NaN, "max_medals": 2905, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 27, "rb": 0, "art": 32, "total_start": NaN, "max_medals": 2811, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 13, "art": 31, "total_start": NaN, "max_medals": 1494, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 17, "art": 37, "total_start": NaN, "max_medals": 4910, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 8, "art": 21, "total_start": NaN, "max_medals": 797, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 540, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1333, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 16, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1214, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 2, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 552, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 780, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 11, "art": 7, "total_start": NaN, "max_medals": 515, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 5, "art": 2, "total_start": NaN, "max_medals": 344, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 30, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 8787, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 13, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 4031, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 15, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 1226, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 20, "rb": 29, "art": 0, "total_start": NaN, "max_medals": 1300, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 11, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 573, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 20, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 2100, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 11, "rb": 0, "art": 18, "total_start": NaN, "max_medals": 2233, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 2, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 531, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 4, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 2047, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 8, "art": 27, "total_start": NaN, "max_medals": 844, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 6, "art": 34, "total_start": NaN, "max_medals": 1298, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 5, "art": 37, "total_start": NaN, "max_medals": 1979, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 22, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2028, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 563, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 7, "art": 38, "total_start": NaN, "max_medals": 2690, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 8, "art": 41, "total_start": NaN, "max_medals": 1795, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 620, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 14, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1305, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 7, "art": 33, "total_start": NaN, "max_medals": 7349, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 24, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 1811, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 19, "art": 44, "total_start": NaN, "max_medals": 1403, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 10, "art": 21, "total_start": NaN, "max_medals": 2853, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 9, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 7, "art": 21, "total_start": NaN, "max_medals": 1451, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 5, "art": 4, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 6, "art": 20, "total_start": NaN, "max_medals": 1430, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 0, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 504, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 9, "art": 23, "total_start": NaN, "max_medals": 3133, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1103, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 16, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1850, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 49, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 2973, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 8, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 1749, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 11, "art": 37, "total_start": NaN, "max_medals": 1325, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 4568, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 12, "art": 46, "total_start": NaN, "max_medals": 2008, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 8, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 785, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 12, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 248, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 5, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 1065, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 25, "art": 21, "total_start": NaN, "max_medals": 649, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 3, "art": 10, "total_start": NaN, "max_medals": 1513, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 10, "art": 39, "total_start": NaN, "max_medals": 4831, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 13, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 4047, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 771, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 24, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 1530, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 254, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 17, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 710, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 3227, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 30, "art": 67, "total_start": NaN, "max_medals": 2468, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 2, "art": 15, "total_start": NaN, "max_medals": 1535, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 382, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 912, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1581, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 790, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 635, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 2235, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1227, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 770, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 609, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2801, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1223, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 28, "art": 0, "total_start": NaN, "max_medals": 1894, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1826, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 1680, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 3327, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 371, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1455, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 565, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 2196, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1122, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1165, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 479, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 2564, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 540, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 509, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 3379, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 622, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 975, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 515, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 32, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 2617, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 633, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 673, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1985, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 257, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 614, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1877, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1076, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2750, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1718, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 4, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 513, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1659, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2595, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3804, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1365, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 22, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 3792, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 930, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1170, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2435, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 17, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2814, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 489, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1275, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1352, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 596, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1482, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 3410, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 226, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 4, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 925, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 4153, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 19, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1406, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 970, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2735, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1399, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1708, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 9, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1761, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2358, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 7, "art": 16, "total_start": NaN, "max_medals": 599, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 12, "art": 48, "total_start": NaN, "max_medals": 3362, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 8, "art": 29, "total_start": NaN, "max_medals": 2061, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 39, "total_start": NaN, "max_medals": 2924, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 28, "art": 90, "total_start": NaN, "max_medals": 5715, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 2, "art": 7, "total_start": NaN, "max_medals": 733, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 23, "total_start": NaN, "max_medals": 2131, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 53, "total_start": NaN, "max_medals": 6913, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 11, "total_start": NaN, "max_medals": 694, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 25, "total_start": NaN, "max_medals": 1185, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 28, "total_start": NaN, "max_medals": 3039, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 39, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 5, "art": 15, "total_start": NaN, "max_medals": 819, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 26, "total_start": NaN, "max_medals": 1108, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 9, "art": 16, "total_start": NaN, "max_medals": 781, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 30, "total_start": NaN, "max_medals": 1151, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 16, "total_start": NaN, "max_medals": 798, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 16, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1535, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 2799, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 347, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 10, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 866, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 364, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 4, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 262, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 346, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 802, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 427, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 972, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 882, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 10, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 601, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 488, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 953, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 6, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 790, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 970, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 44, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 4556, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 134, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 8, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1695, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 4561, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1847, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1553, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 221, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1845, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 674, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 17, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 2999, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 3, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 801, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 23, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 3310, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 2, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 666, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 27, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 5329, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 779, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1391, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 20, "total_start": NaN, "max_medals": 1073, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 19, "art": 74, "total_start": NaN, "max_medals": 3351, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 4, "art": 9, "total_start": NaN, "max_medals": 500, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 61, "total_start": NaN, "max_medals": 6832, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 71, "total_start": NaN, "max_medals": 6629, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 46, "total_start": NaN, "max_medals": 4682, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 23, "art": 83, "total_start": NaN, "max_medals": 3791, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 13, "art": 49, "total_start": NaN, "max_medals": 1515, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 96, "total_start": NaN, "max_medals": 10236, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 1, "art": 7, "total_start": NaN, "max_medals": 931, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 174, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 4, "art": 16, "total_start": NaN, "max_medals": 1005, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 12, "art": 39, "total_start": NaN, "max_medals": 1107, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 16, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 6, "art": 13, "total_start": NaN, "max_medals": 694, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 20, "art": 84, "total_start": NaN, "max_medals": 4649, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 11, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 983, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 19, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 1682, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 509, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 403, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 24, "rb": 5, "art": 9, "total_start": NaN, "max_medals": 2558, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 4, "art": 12, "total_start": NaN, "max_medals": 1254, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 15, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 6, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 919, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 10, "rb": 2, "art": 5, "total_start": NaN, "max_medals": 1465, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 14, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 1972, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 16, "art": 54, "total_start": NaN, "max_medals": 6459, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 27, "art": 59, "total_start": NaN, "max_medals": 3022, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 5, "art": 6, "total_start": NaN, "max_medals": 289, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 6, "art": 10, "total_start": NaN, "max_medals": 815, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 14, "total_start": NaN, "max_medals": 595, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 40, "total_start": NaN, "max_medals": 2507, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 69, "total_start": NaN, "max_medals": 9466, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 9, "art": 18, "total_start": NaN, "max_medals": 2150, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 21, "total_start": NaN, "max_medals": 2232, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 8, "art": 8, "total_start": NaN, "max_medals": 303, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 37, "total_start": NaN, "max_medals": 2189, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 38, "total_start": NaN, "max_medals": 4879, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 21, "total_start": NaN, "max_medals": 2019, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 58, "total_start": NaN, "max_medals": 9945, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 28, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2751, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 999, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 783, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 23, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1638, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1215, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1177, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 27, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 1845, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 18, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 34, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 2615, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1497, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 33, "rb": 32, "art": 0, "total_start": NaN, "max_medals": 3793, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 246, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 10, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 788, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 18, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 779, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 35, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3513, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 18, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1798, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 33, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 2722, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 2, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 503, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 699, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1634, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1278, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 569, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 15, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1025, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1013, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 11, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1147, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 8, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1405, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1262, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 667, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 417, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 1, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 287, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 19, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1956, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1012, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 12, "art": 38, "total_start": NaN, "max_medals": 6248, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 13, "art": 23, "total_start": NaN, "max_medals": 1458, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 41, "total_start": NaN, "max_medals": 2258, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 34, "total_start": NaN, "max_medals": 1596, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 15, "art": 33, "total_start": NaN, "max_medals": 1274, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 14, "art": 12, "total_start": NaN, "max_medals": 763, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 23, "art": 37, "total_start": NaN, "max_medals": 2999, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 17, "art": 38, "total_start": NaN, "max_medals": 2146, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 5, "rb": 5, "art": 2, "total_start": NaN, "max_medals": 785, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 15, "rb": 11, "art": 8, "total_start": NaN, "max_medals": 1086, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 2, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 190, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 8, "rb": 6, "art": 5, "total_start": NaN, "max_medals": 319, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 10, "rb": 18, "art": 1, "total_start": NaN, "max_medals": 4792, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 3, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 260, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 7, "rb": 6, "art": 3, "total_start": NaN, "max_medals": 1338, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 12, "rb": 12, "art": 3, "total_start": NaN, "max_medals": 3144, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 5, "art": 39, "total_start": NaN, "max_medals": 3544, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1046, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 11, "art": 41, "total_start": NaN, "max_medals": 5223, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 8, "art": 13, "total_start": NaN, "max_medals": 527, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 11, "art": 29, "total_start": NaN, "max_medals": 4733, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 1, "art": 9, "total_start": NaN, "max_medals": 1063, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 0, "rb": 3, "art": 4, "total_start": NaN, "max_medals": 85, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 0, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 21, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 6, "art": 9, "total_start": NaN, "max_medals": 843, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 3, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 321, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 1, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 279, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 1741, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 14, "rb": 8, "art": 20, "total_start": NaN, "max_medals": 2063, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 4, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 3, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 334, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 10, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 944, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 317, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 3, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 709, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 9, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 2994, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 16, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 900, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 31, "rb": 0, "art": 18, "total_start": NaN, "max_medals": 526, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 17, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 9, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 461, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 9, "art": 28, "total_start": NaN, "max_medals": 2251, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 129, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 105, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1698, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 1, "art": 11, "total_start": NaN, "max_medals": 937, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 13, "art": 38, "total_start": NaN, "max_medals": 2268, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 845, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 19, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 4, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 333, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 247, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 750, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 0, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 110, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 326, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 899, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 1478, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 17, "total_start": NaN, "max_medals": 2157, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 11, "total_start": NaN, "max_medals": 582, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 546, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 3, "art": 22, "total_start": NaN, "max_medals": 2066, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 274, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 22, "rb": 3, "art": 6, "total_start": NaN, "max_medals": 2447, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 1, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 391, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1198, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1118, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 13, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1363, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 27, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1677, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 2145, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 264, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 12, "rb": 32, "art": 0, "total_start": NaN, "max_medals": 790, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 921, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 27, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 2025, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 811, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 11, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 924, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 689, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 12, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 988, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 249, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 172, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 5, "art": 7, "total_start": NaN, "max_medals": 1259, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 10, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 508, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 24, "total_start": NaN, "max_medals": 1415, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 37, "total_start": NaN, "max_medals": 7570, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 12, "total_start": NaN, "max_medals": 1058, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 3165, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 7, "art": 12, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 192, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 3, "art": 10, "total_start": NaN, "max_medals": 939, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 24, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 5824, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 12, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2408, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 688, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 456, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 479, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 23, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 4, "art": 17, "total_start": NaN, "max_medals": 3135, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 11, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1058, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1378, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1296, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 2, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 254, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 8, "art": 16, "total_start": NaN, "max_medals": 1934, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 1082, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 4, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 212, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 3006, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 75, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 569, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 822, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 4, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 735, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 11, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 2294, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 7, "rb": 0, "art": 20, "total_start": NaN, "max_medals": 4126, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 873, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 5, "total_start": NaN, "max_medals": 599, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 846, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 612, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2200, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 28, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 1528, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 10, "art": 17, "total_start": NaN, "max_medals": 1748, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 470, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 87, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 83, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 6, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 355, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 908, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 422, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 32, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1997, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 2, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 499, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 101, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 1, "art": 7, "total_start": NaN, "max_medals": 771, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 1, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 496, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 110, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 10, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 17, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 357, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 1477, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 18, "art": 45, "total_start": NaN, "max_medals": 1317, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 2, "art": 12, "total_start": NaN, "max_medals": 2027, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 5, "art": 2, "total_start": NaN, "max_medals": 90, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 3, "art": 4, "total_start": NaN, "max_medals": 703, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 12, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 8, "rb": 0, "art": 51, "total_start": NaN, "max_medals": 4825, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 4, "art": 14, "total_start": NaN, "max_medals": 1511, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 13, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1861, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 854, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 20, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1291, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 111, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 453, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 6, "art": 24, "total_start": NaN, "max_medals": 4481, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 4, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 891, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 19, "rb": 0, "art": 35, "total_start": NaN, "max_medals": 2146, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 21, "art": 30, "total_start": NaN, "max_medals": 1664, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 851, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 4, "art": 4, "total_start": NaN, "max_medals": 487, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 3, "art": 3, "total_start": NaN, "max_medals": 328, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 9, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 536, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 15, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 1240, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 33, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1122, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 3, "art": 8, "total_start": NaN, "max_medals": 1558, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 186, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 2, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 638, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 15, "art": 43, "total_start": NaN, "max_medals": 3285, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 3, "art": 26, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1619, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2367, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 584, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 779, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 20, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1507, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 995, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1532, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1697, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 345, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 942, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 380, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 645, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1270, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1249, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 1961, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1486, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 537, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 2208, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 619, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 970, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 490, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 598, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 736, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 487, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1797, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 639, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1069, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 2761, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1275, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1156, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 484, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1241, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 588, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 2, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 351, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 29, "art": 0, "total_start": NaN, "max_medals": 1787, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1094, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1086, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 757, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 635, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 2707, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1963, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 729, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1691, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 717, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1408, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2280, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1254, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 989, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1182, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1029, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1298, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 792, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 22, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 3989, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 15, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 834, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1872, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 11, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1151, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1425, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1020, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2002, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 19, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2800, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3419, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 27, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 3611, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 11, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1495, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2028, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 41, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 7343, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 20, "art": 60, "total_start": NaN, "max_medals": 4810, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 50, "total_start": NaN, "max_medals": 2147, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 25, "total_start": NaN, "max_medals": 804, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 24, "total_start": NaN, "max_medals": 1623, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 49, "total_start": NaN, "max_medals": 6558, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 35, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 20, "art": 63, "total_start": NaN, "max_medals": 3911, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 18, "art": 35, "total_start": NaN, "max_medals": 561, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 18, "art": 56, "total_start": NaN, "max_medals": 2734, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 9, "art": 36, "total_start": NaN, "max_medals": 3173, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 8, "art": 12, "total_start": NaN, "max_medals": 375, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 21, "art": 49, "total_start": NaN, "max_medals": 2625, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 478, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 17, "art": 86, "total_start": NaN, "max_medals": 9468, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 12, "art": 37, "total_start": NaN, "max_medals": 881, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 3111, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 43, "total_start": NaN, "max_medals": 2317, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 20, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1747, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 127, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 21, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 12, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 658, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 120, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 285, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 14, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1467, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 460, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 18, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1866, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1523, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 489, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 369, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 181, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 105, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 11, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1135, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 19, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2658, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 1, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 501, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 966, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 2605, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 4105, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 22, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 2755, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1106, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 16, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1662, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 596, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 976, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 9, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 605, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 11, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1431, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1671, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 9, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1684, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 921, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 17, "art": 39, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 476, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 80, "total_start": NaN, "max_medals": 5706, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 23, "total_start": NaN, "max_medals": 925, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 426, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 36, "total_start": NaN, "max_medals": 944, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 27, "total_start": NaN, "max_medals": 1392, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 50, "total_start": NaN, "max_medals": 3839, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 8, "art": 15, "total_start": NaN, "max_medals": 464, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 4, "art": 10, "total_start": NaN, "max_medals": 652, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 20, "art": 72, "total_start": NaN, "max_medals": 2096, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 6, "art": 58, "total_start": NaN, "max_medals": 8295, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 39, "total_start": NaN, "max_medals": 3797, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 10, "art": 60, "total_start": NaN, "max_medals": 6152, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 32, "total_start": NaN, "max_medals": 2031, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 24, "total_start": NaN, "max_medals": 845, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 22, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 3153, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 22, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 1373, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 159, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 27, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 4116, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 40, "rb": 5, "art": 10, "total_start": NaN, "max_medals": 2889, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 50, "rb": 3, "art": 12, "total_start": NaN, "max_medals": 3875, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 465, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 72, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 9871, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 102, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 149, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 419, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 20, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 1969, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 813, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 3, "art": 8, "total_start": NaN, "max_medals": 600, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 7857, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 19, "total_start": NaN, "max_medals": 635, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 12, "art": 14, "total_start": NaN, "max_medals": 858, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 9, "art": 17, "total_start": NaN, "max_medals": 2446, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 11, "art": 39, "total_start": NaN, "max_medals": 3322, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 18, "total_start": NaN, "max_medals": 1050, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 23, "art": 35, "total_start": NaN, "max_medals": 2603, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 34, "total_start": NaN, "max_medals": 1985, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 28, "art": 58, "total_start": NaN, "max_medals": 6056, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 6, "art": 30, "total_start": NaN, "max_medals": 6014, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 19, "art": 38, "total_start": NaN, "max_medals": 4328, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 5, "art": 5, "total_start": NaN, "max_medals": 353, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 24, "art": 47, "total_start": NaN, "max_medals": 6592, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 14, "total_start": NaN, "max_medals": 949, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 955, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 9, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 850, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 2, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 294, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 699, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 399, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1002, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 715, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 21, "rb": 29, "art": 0, "total_start": NaN, "max_medals": 1592, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 3, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 445, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 17, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1370, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 26, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 38, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 4551, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 752, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 10, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 781, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 894, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 745, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1419, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 22, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1928, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 14, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1188, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 659, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 16, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 932, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 22, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1386, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 29, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2237, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1019, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 16, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1458, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 36, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3409, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 18, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1088, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 33, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1792, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 87, "rb": 28, "art": 0, "total_start": NaN, "max_medals": 13776, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 623, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 80, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 11700, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 47, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 4669, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 20, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3111, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 30, "total_start": NaN, "max_medals": 1059, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 47, "total_start": NaN, "max_medals": 2326, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 24, "art": 25, "total_start": NaN, "max_medals": 831, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 43, "total_start": NaN, "max_medals": 5714, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 21, "art": 21, "total_start": NaN, "max_medals": 3523, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 12, "art": 28, "total_start": NaN, "max_medals": 1503, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 14, "art": 16, "total_start": NaN, "max_medals": 1845, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 33, "total_start": NaN, "max_medals": 3277, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 24, "rb": 45, "art": 8, "total_start": NaN, "max_medals": 6180, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 9, "rb": 8, "art": 4, "total_start": NaN, "max_medals": 1097, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 13, "art": 9, "total_start": NaN, "max_medals": 1235, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 14, "rb": 9, "art": 6, "total_start": NaN, "max_medals": 1566, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 10, "art": 7, "total_start": NaN, "max_medals": 793, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 12, "rb": 10, "art": 3, "total_start": NaN, "max_medals": 2236, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 32, "rb": 25, "art": 17, "total_start": NaN, "max_medals": 1346, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 20, "art": 6, "total_start": NaN, "max_medals": 5573, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 243, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 15, "total_start": NaN, "max_medals": 1576, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 20, "art": 69, "total_start": NaN, "max_medals": 4100, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 14, "total_start": NaN, "max_medals": 1170, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 167, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 13, "art": 69, "total_start": NaN, "max_medals": 8822, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 3, "art": 13, "total_start": NaN, "max_medals": 1373, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 31, "rb": 3, "art": 11, "total_start": NaN, "max_medals": 6509, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 5, "art": 13, "total_start": NaN, "max_medals": 2063, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 6, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 937, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 3, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 525, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 4, "art": 13, "total_start": NaN, "max_medals": 3516, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 5, "art": 14, "total_start": NaN, "max_medals": 3131, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 63, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 20, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 2508, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 5, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 979, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 5, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 1247, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 320, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 9, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 818, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 29, "rb": 0, "art": 38, "total_start": NaN, "max_medals": 3294, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 2, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 122, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 16, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 983, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 20, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 1328, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 13, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 830, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 130, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 147, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 295, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 721, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 890, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 10, "art": 29, "total_start": NaN, "max_medals": 1634, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 17, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1273, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1907, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 11, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 812, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1566, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 676, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 10, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 876, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1914, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 1422, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 6, "art": 23, "total_start": NaN, "max_medals": 1483, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 8, "art": 19, "total_start": NaN, "max_medals": 849, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 515, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 9, "art": 36, "total_start": NaN, "max_medals": 2639, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 4, "art": 9, "total_start": NaN, "max_medals": 947, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 4, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 8, "art": 12, "total_start": NaN, "max_medals": 941, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 6, "art": 17, "total_start": NaN, "max_medals": 875, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 4, "art": 5, "total_start": NaN, "max_medals": 390, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 423, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 3, "art": 5, "total_start": NaN, "max_medals": 723, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 25, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 423, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 693, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 18, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 827, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 15, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1075, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 914, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 24, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 1577, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 722, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 819, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 14, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1674, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 630, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 16, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1169, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 14, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 898, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 14, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 715, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 19, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1813, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 6, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 457, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1343, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 4, "art": 11, "total_start": NaN, "max_medals": 993, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 597, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 105, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 471, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 16, "total_start": NaN, "max_medals": 2001, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 931, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 10, "total_start": NaN, "max_medals": 1014, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 21, "total_start": NaN, "max_medals": 6122, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 15, "art": 39, "total_start": NaN, "max_medals": 3280, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 552, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 7, "art": 10, "total_start": NaN, "max_medals": 514, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 15, "art": 28, "total_start": NaN, "max_medals": 1436, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 249, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 239, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 50, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 10558, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 193, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 7, "total_start": NaN, "max_medals": 1027, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 1831, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 7, "total_start": NaN, "max_medals": 1142, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 311, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 13, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1008, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 595, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 980, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 25, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1412, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 9, "art": 19, "total_start": NaN, "max_medals": 1226, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 9, "art": 11, "total_start": NaN, "max_medals": 1259, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 5, "art": 35, "total_start": NaN, "max_medals": 7805, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 6, "art": 20, "total_start": NaN, "max_medals": 1924, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 4, "art": 15, "total_start": NaN, "max_medals": 1171, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 85, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 90, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 7, "art": 20, "total_start": NaN, "max_medals": 4199, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1867, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 75, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 999, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 84, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 762, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 11, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1112, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 25, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 1853, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 15, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 996, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 12, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 2539, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 2, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 179, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 4, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 4626, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 12, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 2044, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 15, "art": 35, "total_start": NaN, "max_medals": 6278, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 460, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 12, "art": 32, "total_start": NaN, "max_medals": 1550, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 7, "art": 18, "total_start": NaN, "max_medals": 1332, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 14, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1095, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 319, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 389, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 6, "art": 12, "total_start": NaN, "max_medals": 1623, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 9, "art": 40, "total_start": NaN, "max_medals": 7137, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 43, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 5, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 1016, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 8, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 594, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 6, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 625, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 653, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 32, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 2050, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1323, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 486, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 12, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 507, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 17, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 1748, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 3, "art": 85, "total_start": NaN, "max_medals": 7208, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 2, "art": 27, "total_start": NaN, "max_medals": 3643, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 3, "art": 41, "total_start": NaN, "max_medals": 2720, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 11, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1483, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 3, "art": 18, "total_start": NaN, "max_medals": 1964, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 4, "art": 23, "total_start": NaN, "max_medals": 1002, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 3, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 518, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1799, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 5, "art": 7, "total_start": NaN, "max_medals": 411, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 38, "rb": 0, "art": 27, "total_start": NaN, "max_medals": 3589, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 7, "art": 41, "total_start": NaN, "max_medals": 3813, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 19, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 2, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 133, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 8, "art": 13, "total_start": NaN, "max_medals": 975, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 6, "art": 4, "total_start": NaN, "max_medals": 451, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 86, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 159, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 10, "art": 18, "total_start": NaN, "max_medals": 1857, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 24, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 3043, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 17, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2942, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 31, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1870, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 4, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 248, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 12, "art": 16, "total_start": NaN, "max_medals": 889, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 7, "art": 30, "total_start": NaN, "max_medals": 4890, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 668, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 14, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 798, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 929, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 23, "art": 34, "total_start": NaN, "max_medals": 3018, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 4, "art": 25, "total_start": NaN, "max_medals": 1638, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 5, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 4912, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 37, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1949, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 109, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 5, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 195, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 9, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1464, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 32, "art": 92, "total_start": NaN, "max_medals": 4947, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 113, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1078, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 406, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 2052, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 771, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 891, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1018, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1210, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 875, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1564, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 582, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 40, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3377, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 677, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 814, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 919, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1773, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1824, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1363, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1526, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2234, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 737, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1755, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1144, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 701, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1472, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1114, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 32, "art": 0, "total_start": NaN, "max_medals": 1444, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1231, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 40, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2556, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 34, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1856, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1313, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1450, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 744, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1223, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1280, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1687, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 1825, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 2057, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1089, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 847, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1633, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 34, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 6782, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2475, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1841, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 6, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 604, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 745, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 30, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 3421, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 2711, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2810, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 20, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 2909, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2255, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 826, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1904, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 51, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 8181, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 32, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 4392, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 3217, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 899, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1667, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 28, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2480, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 789, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1450, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 38, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 3243, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 20, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 2663, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 46, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 6889, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1357, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 646, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 30, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2233, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 19, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 2856, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 36, "total_start": NaN, "max_medals": 2190, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 39, "total_start": NaN, "max_medals": 1114, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 51, "total_start": NaN, "max_medals": 7346, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 54, "total_start": NaN, "max_medals": 4275, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 17, "art": 64, "total_start": NaN, "max_medals": 2605, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 31, "total_start": NaN, "max_medals": 839, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 28, "art": 50, "total_start": NaN, "max_medals": 909, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 35, "total_start": NaN, "max_medals": 2449, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 36, "total_start": NaN, "max_medals": 1827, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 18, "art": 58, "total_start": NaN, "max_medals": 3473, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 29, "total_start": NaN, "max_medals": 745, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 20, "total_start": NaN, "max_medals": 591, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 34, "total_start": NaN, "max_medals": 1409, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 21, "total_start": NaN, "max_medals": 570, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 55, "total_start": NaN, "max_medals": 2721, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 37, "total_start": NaN, "max_medals": 1377, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 17, "art": 58, "total_start": NaN, "max_medals": 4764, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 31, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 833, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 382, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 2040, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 8, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 32, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1589, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 557, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 45, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1471, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 467, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 15, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 702, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 81, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 3050, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 17, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1147, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 15, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1009, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 20, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1715, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 17, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1686, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1024, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 25, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1091, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 20, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1156, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2883, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2577, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1530, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 933, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 16, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1574, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1437, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 11, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 643, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 4456, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 846, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 41, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 4552, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 1276, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1121, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1178, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 4, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 717, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 956, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 39, "total_start": NaN, "max_medals": 997, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 22, "art": 85, "total_start": NaN, "max_medals": 3570, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 8, "art": 29, "total_start": NaN, "max_medals": 1323, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 72, "total_start": NaN, "max_medals": 4873, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 59, "total_start": NaN, "max_medals": 3577, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 23, "art": 67, "total_start": NaN, "max_medals": 3277, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 42, "total_start": NaN, "max_medals": 1519, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 48, "total_start": NaN, "max_medals": 2077, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 81, "total_start": NaN, "max_medals": 5815, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 10, "art": 77, "total_start": NaN, "max_medals": 5846, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 72, "total_start": NaN, "max_medals": 2345, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 26, "art": 66, "total_start": NaN, "max_medals": 2019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 68, "total_start": NaN, "max_medals": 5759, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 74, "total_start": NaN, "max_medals": 5425, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 17, "art": 53, "total_start": NaN, "max_medals": 1870, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 49, "total_start": NaN, "max_medals": 1727, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 68, "rb": 3, "art": 12, "total_start": NaN, "max_medals": 8296, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 61, "rb": 8, "art": 14, "total_start": NaN, "max_medals": 6042, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 135, "rb": 1, "art": 10, "total_start": NaN, "max_medals": 16727, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 85, "rb": 12, "art": 28, "total_start": NaN, "max_medals": 7244, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 8, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 1326, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 21, "rb": 7, "art": 23, "total_start": NaN, "max_medals": 851, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 72, "rb": 5, "art": 16, "total_start": NaN, "max_medals": 5809, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 120, "rb": 5, "art": 19, "total_start": NaN, "max_medals": 11673, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 18, "rb": 4, "art": 8, "total_start": NaN, "max_medals": 2189, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 54, "rb": 5, "art": 19, "total_start": NaN, "max_medals": 4934, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 796, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 47, "rb": 4, "art": 25, "total_start": NaN, "max_medals": 2376, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 69, "rb": 4, "art": 12, "total_start": NaN, "max_medals": 5031, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 94, "rb": 2, "art": 22, "total_start": NaN, "max_medals": 10423, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 49, "total_start": NaN, "max_medals": 7271, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 11, "art": 28, "total_start": NaN, "max_medals": 5157, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 51, "total_start": NaN, "max_medals": 8139, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 26, "total_start": NaN, "max_medals": 2358, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 21, "art": 36, "total_start": NaN, "max_medals": 4483, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 19, "total_start": NaN, "max_medals": 1140, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 22, "total_start": NaN, "max_medals": 1736, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 27, "total_start": NaN, "max_medals": 2628, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 26, "art": 26, "total_start": NaN, "max_medals": 528, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 34, "art": 53, "total_start": NaN, "max_medals": 3123, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 23, "total_start": NaN, "max_medals": 2477, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 37, "total_start": NaN, "max_medals": 3489, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 24, "total_start": NaN, "max_medals": 4369, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 22, "art": 26, "total_start": NaN, "max_medals": 1222, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 36, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 2322, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 855, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 33, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2304, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 26, "rb": 34, "art": 0, "total_start": NaN, "max_medals": 2201, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1200, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 650, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 36, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1709, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 24, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1163, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 28, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 2101, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 593, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 16, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1170, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 9, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 513, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 21, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 1294, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 41, "rb": 33, "art": 0, "total_start": NaN, "max_medals": 3841, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1093, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 23, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1278, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1063, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 24, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 817, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 18, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 947, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 20, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 916, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 19, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1095, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 32, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 2286, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 553, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 45, "rb": 31, "art": 0, "total_start": NaN, "max_medals": 4135, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 18, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 62, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 7674, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 31, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1908, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 40, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 3400, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 43, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 5715, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 54, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 8401, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 56, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 6079, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 43, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 3894, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 39, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 4127, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 50, "total_start": NaN, "max_medals": 3888, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 26, "art": 29, "total_start": NaN, "max_medals": 1448, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 33, "total_start": NaN, "max_medals": 2019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 23, "art": 38, "total_start": NaN, "max_medals": 4005, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 24, "total_start": NaN, "max_medals": 1490, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 20, "art": 42, "total_start": NaN, "max_medals": 4880, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 17, "art": 55, "total_start": NaN, "max_medals": 4354, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 26, "total_start": NaN, "max_medals": 999, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 30, "rb": 43, "art": 11, "total_start": NaN, "max_medals": 6724, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 15, "rb": 9, "art": 5, "total_start": NaN, "max_medals": 1325, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 24, "rb": 15, "art": 9, "total_start": NaN, "max_medals": 1754, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 12, "rb": 9, "art": 4, "total_start": NaN, "max_medals": 1478, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 22, "rb": 14, "art": 9, "total_start": NaN, "max_medals": 1463, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 14, "rb": 5, "art": 4, "total_start": NaN, "max_medals": 616, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 6, "rb": 7, "art": 7, "total_start": NaN, "max_medals": 317, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 17, "rb": 8, "art": 4, "total_start": NaN, "max_medals": 2133, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 17, "art": 40, "total_start": NaN, "max_medals": 1797, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 12, "art": 34, "total_start": NaN, "max_medals": 1435, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 5, "art": 19, "total_start": NaN, "max_medals": 3333, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 748, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 15, "art": 40, "total_start": NaN, "max_medals": 3714, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 15, "art": 60, "total_start": NaN, "max_medals": 1647, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 4, "art": 31, "total_start": NaN, "max_medals": 1357, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 9, "art": 31, "total_start": NaN, "max_medals": 1205, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 6, "rb": 5, "art": 16, "total_start": NaN, "max_medals": 857, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 11, "rb": 5, "art": 7, "total_start": NaN, "max_medals": 1574, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 34, "rb": 5, "art": 21, "total_start": NaN, "max_medals": 7062, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 16, "rb": 4, "art": 13, "total_start": NaN, "max_medals": 3031, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 12, "rb": 6, "art": 23, "total_start": NaN, "max_medals": 665, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 12, "rb": 7, "art": 17, "total_start": NaN, "max_medals": 473, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 49, "rb": 4, "art": 15, "total_start": NaN, "max_medals": 9545, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 19, "rb": 6, "art": 26, "total_start": NaN, "max_medals": 1567, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 827, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 291, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 417, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 31, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 1654, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 30, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 2167, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 1711, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 14, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 3558, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 28, "rb": 0, "art": 32, "total_start": NaN, "max_medals": 2356, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 44, "rb": 0, "art": 35, "total_start": NaN, "max_medals": 1433, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 12, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 598, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 8, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 255, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 18, "rb": 0, "art": 20, "total_start": NaN, "max_medals": 1019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 27, "rb": 0, "art": 32, "total_start": NaN, "max_medals": 2744, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 18, "rb": 0, "art": 24, "total_start": NaN, "max_medals": 2676, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 14, "art": 35, "total_start": NaN, "max_medals": 2950, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 11, "art": 24, "total_start": NaN, "max_medals": 1452, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 11, "art": 37, "total_start": NaN, "max_medals": 4566, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 1, "art": 12, "total_start": NaN, "max_medals": 379, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 1, "art": 32, "total_start": NaN, "max_medals": 2742, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 3, "art": 19, "total_start": NaN, "max_medals": 934, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2347, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 23, "rb": 35, "art": 0, "total_start": NaN, "max_medals": 1466, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 750, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 30, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 1863, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 17, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1906, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 25, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1436, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 9, "art": 17, "total_start": NaN, "max_medals": 736, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 7, "art": 43, "total_start": NaN, "max_medals": 3217, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 10, "art": 92, "total_start": NaN, "max_medals": 9136, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 14, "art": 53, "total_start": NaN, "max_medals": 2133, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 13, "art": 83, "total_start": NaN, "max_medals": 4874, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 6, "art": 21, "total_start": NaN, "max_medals": 1271, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 9, "art": 29, "total_start": NaN, "max_medals": 1838, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 13, "art": 53, "total_start": NaN, "max_medals": 5147, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 16, "art": 44, "total_start": NaN, "max_medals": 2285, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 4, "art": 22, "total_start": NaN, "max_medals": 1240, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 15, "art": 43, "total_start": NaN, "max_medals": 1129, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 17, "art": 70, "total_start": NaN, "max_medals": 3709, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 5, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 769, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 459, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 493, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 675, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 11, "rb": 1, "art": 8, "total_start": NaN, "max_medals": 1403, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 45, "rb": 4, "art": 12, "total_start": NaN, "max_medals": 1869, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 20, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1206, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 962, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 20, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1056, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 21, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 971, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 34, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 2255, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 16, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1870, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 432, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 586, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 15, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1638, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 33, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 3385, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 28, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2013, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 13, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 571, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 21, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1632, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 619, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 7, "art": 16, "total_start": NaN, "max_medals": 1258, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 477, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 1515, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 244, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 37, "total_start": NaN, "max_medals": 11338, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 38, "total_start": NaN, "max_medals": 5615, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 34, "total_start": NaN, "max_medals": 8629, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 26, "total_start": NaN, "max_medals": 4445, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 12, "art": 32, "total_start": NaN, "max_medals": 1356, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 22, "art": 53, "total_start": NaN, "max_medals": 2587, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 12, "art": 24, "total_start": NaN, "max_medals": 870, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 27, "art": 55, "total_start": NaN, "max_medals": 2895, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 36, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 6318, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 848, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 232, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 822, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 16, "art": 33, "total_start": NaN, "max_medals": 1833, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 7, "art": 15, "total_start": NaN, "max_medals": 2333, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 5, "total_start": NaN, "max_medals": 1100, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 9, "art": 13, "total_start": NaN, "max_medals": 728, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 27, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1086, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 18, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1041, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 26, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 2402, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 246, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 9, "art": 18, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 7, "art": 25, "total_start": NaN, "max_medals": 6354, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 13, "art": 17, "total_start": NaN, "max_medals": 2366, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 8, "art": 32, "total_start": NaN, "max_medals": 3530, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 9, "art": 31, "total_start": NaN, "max_medals": 5504, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 6, "art": 27, "total_start": NaN, "max_medals": 5445, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 7, "art": 11, "total_start": NaN, "max_medals": 756, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 3, "art": 4, "total_start": NaN, "max_medals": 379, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1724, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 1, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 3, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 751, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 11, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 4219, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 24, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 6593, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 14, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2045, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 33, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 3630, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 15, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 2244, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 9, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 2967, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 11, "rb": 0, "art": 23, "total_start": NaN, "max_medals": 5812, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 24, "rb": 0, "art": 30, "total_start": NaN, "max_medals": 5281, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 16, "rb": 0, "art": 22, "total_start": NaN, "max_medals": 1292, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 12, "art": 27, "total_start": NaN, "max_medals": 1492, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 4, "art": 10, "total_start": NaN, "max_medals": 868, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 6, "art": 11, "total_start": NaN, "max_medals": 1107, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 10, "art": 22, "total_start": NaN, "max_medals": 3409, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 3, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 323, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 14, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1023, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 10, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 4, "art": 5, "total_start": NaN, "max_medals": 776, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 15, "art": 30, "total_start": NaN, "max_medals": 1787, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 8, "art": 19, "total_start": NaN, "max_medals": 2656, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 15, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 1272, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 15, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 3117, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 36, "rb": 0, "art": 16, "total_start": NaN, "max_medals": 5217, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 23, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1219, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 7, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 350, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 14, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 1131, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 15, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 1701, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 20, "rb": 0, "art": 28, "total_start": NaN, "max_medals": 2656, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 4, "art": 29, "total_start": NaN, "max_medals": 1619, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 10, "art": 53, "total_start": NaN, "max_medals": 3748, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 2, "art": 61, "total_start": NaN, "max_medals": 3272, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 14, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1463, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 435, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 2, "art": 12, "total_start": NaN, "max_medals": 1155, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 2, "art": 21, "total_start": NaN, "max_medals": 2591, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 8, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 691, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 687, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 16, "art": 32, "total_start": NaN, "max_medals": 2632, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 39, "rb": 0, "art": 20, "total_start": NaN, "max_medals": 2539, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 24, "art": 76, "total_start": NaN, "max_medals": 4019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 6, "art": 26, "total_start": NaN, "max_medals": 8144, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 975, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 12, "art": 10, "total_start": NaN, "max_medals": 502, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 4, "art": 7, "total_start": NaN, "max_medals": 885, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 11, "art": 23, "total_start": NaN, "max_medals": 1295, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 17, "rb": 0, "art": 44, "total_start": NaN, "max_medals": 1773, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 775, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 5, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 594, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 22, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 2128, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 43, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 4514, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 12, "rb": 0, "art": 10, "total_start": NaN, "max_medals": 2845, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 10, "art": 28, "total_start": NaN, "max_medals": 1466, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 17, "art": 28, "total_start": NaN, "max_medals": 3256, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 6, "art": 33, "total_start": NaN, "max_medals": 2652, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 7, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 731, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 17, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 1055, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 18, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 4683, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 26, "art": 18, "total_start": NaN, "max_medals": 1088, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 15, "art": 47, "total_start": NaN, "max_medals": 3342, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 21, "art": 83, "total_start": NaN, "max_medals": 4239, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 12, "rb": 0, "art": 10, "total_start": NaN, "max_medals": 492, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 27, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2051, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 24, "rb": 0, "art": 19, "total_start": NaN, "max_medals": 1650, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 7, "art": 17, "total_start": NaN, "max_medals": 4376, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 18, "rb": 0, "art": 29, "total_start": NaN, "max_medals": 1516, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 2, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 681, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 19, "art": 67, "total_start": NaN, "max_medals": 5096, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 7, "art": 37, "total_start": NaN, "max_medals": 1470, "diff_medals": NaN}], "events": {}};
@@ -0,0 +1 @@
+DATA_CHUNKS.push([{"date": "2026-02-11", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1037, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1078, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 895, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1703, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1145, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 983, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 933, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 962, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 40, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2737, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1640, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 733, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 33, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 3217, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 2117, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1642, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 38, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 4413, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1648, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 12, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 682, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1392, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 32, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2101, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 823, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 1394, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1493, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 2270, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1432, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1732, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 803, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1386, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1517, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 836, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 681, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 23, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1575, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 34, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 3322, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1277, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 466, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 2008, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1703, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 2561, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1100, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 2830, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 33, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 6479, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 3732, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1866, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 15, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 3098, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2484, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 3208, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2419, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 30, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 2942, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2846, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1974, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1339, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 27, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1471, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1913, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1516, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 2439, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 2163, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 9, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 712, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 760, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2060, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2984, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1301, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 26, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 4544, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 2655, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 35, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 6502, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3080, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 32, "total_start": NaN, "max_medals": 1035, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 64, "total_start": NaN, "max_medals": 5650, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 30, "total_start": NaN, "max_medals": 1501, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 42, "total_start": NaN, "max_medals": 1342, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 31, "total_start": NaN, "max_medals": 1472, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 8, "art": 35, "total_start": NaN, "max_medals": 1950, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 26, "total_start": NaN, "max_medals": 2731, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 40, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 21, "total_start": NaN, "max_medals": 427, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 51, "total_start": NaN, "max_medals": 3849, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 425, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 68, "total_start": NaN, "max_medals": 5353, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 23, "total_start": NaN, "max_medals": 1171, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 36, "total_start": NaN, "max_medals": 1985, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 34, "total_start": NaN, "max_medals": 1215, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 30, "total_start": NaN, "max_medals": 1399, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 33, "total_start": NaN, "max_medals": 5699, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 12, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1377, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 16, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 765, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 294, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1058, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 32, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 3261, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 15, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 942, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 39, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 2124, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 569, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 32, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1585, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1015, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 258, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 31, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1734, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 608, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 11, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 968, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 9, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 460, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 519, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 670, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 65, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2156, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2140, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1148, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 23, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1984, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1257, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 30, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 6791, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1675, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 1190, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 13, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1202, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 13, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2366, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 23, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2250, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1391, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 24, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3296, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 9, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1300, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2341, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 3452, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 28, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 3335, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 35, "total_start": NaN, "max_medals": 1166, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 17, "art": 86, "total_start": NaN, "max_medals": 3114, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 38, "total_start": NaN, "max_medals": 1687, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 12, "art": 31, "total_start": NaN, "max_medals": 918, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 13, "art": 43, "total_start": NaN, "max_medals": 1154, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 18, "art": 48, "total_start": NaN, "max_medals": 1221, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 21, "art": 93, "total_start": NaN, "max_medals": 7213, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 18, "art": 76, "total_start": NaN, "max_medals": 3291, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 40, "total_start": NaN, "max_medals": 1007, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 18, "art": 64, "total_start": NaN, "max_medals": 1729, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 63, "total_start": NaN, "max_medals": 2896, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 6, "art": 14, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 13, "art": 55, "total_start": NaN, "max_medals": 1423, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 81, "total_start": NaN, "max_medals": 4388, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 21, "total_start": NaN, "max_medals": 911, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 92, "total_start": NaN, "max_medals": 7741, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 37, "rb": 4, "art": 16, "total_start": NaN, "max_medals": 3272, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 14, "rb": 3, "art": 10, "total_start": NaN, "max_medals": 1405, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 37, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 3823, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 6, "art": 14, "total_start": NaN, "max_medals": 620, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 38, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1635, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 60, "rb": 2, "art": 17, "total_start": NaN, "max_medals": 3514, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 49, "rb": 8, "art": 22, "total_start": NaN, "max_medals": 4044, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 89, "rb": 3, "art": 14, "total_start": NaN, "max_medals": 9176, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 18, "rb": 4, "art": 21, "total_start": NaN, "max_medals": 955, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 13, "rb": 5, "art": 13, "total_start": NaN, "max_medals": 743, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 20, "rb": 5, "art": 12, "total_start": NaN, "max_medals": 1222, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 48, "rb": 5, "art": 23, "total_start": NaN, "max_medals": 4540, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 105, "rb": 5, "art": 13, "total_start": NaN, "max_medals": 7901, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 70, "rb": 7, "art": 17, "total_start": NaN, "max_medals": 4713, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 29, "total_start": NaN, "max_medals": 1185, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 17, "total_start": NaN, "max_medals": 3637, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 28, "total_start": NaN, "max_medals": 5038, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 16, "art": 38, "total_start": NaN, "max_medals": 5865, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 12, "art": 58, "total_start": NaN, "max_medals": 9675, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 34, "total_start": NaN, "max_medals": 4247, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 37, "total_start": NaN, "max_medals": 4557, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 25, "total_start": NaN, "max_medals": 1533, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 22, "art": 36, "total_start": NaN, "max_medals": 2203, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 24, "art": 22, "total_start": NaN, "max_medals": 746, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 40, "total_start": NaN, "max_medals": 5901, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 21, "art": 34, "total_start": NaN, "max_medals": 2803, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 16, "art": 36, "total_start": NaN, "max_medals": 5309, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 18, "total_start": NaN, "max_medals": 781, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 690, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 481, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 25, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 1959, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 31, "rb": 30, "art": 0, "total_start": NaN, "max_medals": 1557, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 26, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 1209, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 7, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 471, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 30, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 15, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1317, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 16, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 910, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 7, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 430, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 25, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1372, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 20, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 979, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 20, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 911, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 28, "rb": 33, "art": 0, "total_start": NaN, "max_medals": 1075, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 943, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 19, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 961, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 667, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 31, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1455, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 24, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1599, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1263, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 646, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1356, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 890, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1376, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 45, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 6582, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 938, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1438, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 39, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 4811, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2828, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 45, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 5235, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 28, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 2310, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 15, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 923, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 26, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1800, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 45, "total_start": NaN, "max_medals": 5000, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 16, "art": 25, "total_start": NaN, "max_medals": 1859, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 16, "art": 27, "total_start": NaN, "max_medals": 3085, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 39, "total_start": NaN, "max_medals": 1943, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 43, "total_start": NaN, "max_medals": 2539, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 23, "art": 47, "total_start": NaN, "max_medals": 2081, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 13, "art": 28, "total_start": NaN, "max_medals": 5147, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 29, "total_start": NaN, "max_medals": 1038, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 16, "art": 6, "total_start": NaN, "max_medals": 3112, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 39, "rb": 27, "art": 12, "total_start": NaN, "max_medals": 2240, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 10, "rb": 5, "art": 5, "total_start": NaN, "max_medals": 267, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 38, "rb": 49, "art": 10, "total_start": NaN, "max_medals": 9237, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 28, "rb": 62, "art": 10, "total_start": NaN, "max_medals": 10734, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 14, "rb": 10, "art": 9, "total_start": NaN, "max_medals": 795, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 27, "rb": 52, "art": 6, "total_start": NaN, "max_medals": 6622, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 26, "rb": 21, "art": 9, "total_start": NaN, "max_medals": 2350, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 6, "art": 19, "total_start": NaN, "max_medals": 637, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 4, "art": 25, "total_start": NaN, "max_medals": 5392, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 11, "art": 27, "total_start": NaN, "max_medals": 1405, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 4, "art": 6, "total_start": NaN, "max_medals": 420, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 12, "art": 32, "total_start": NaN, "max_medals": 1415, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 891, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 12, "art": 52, "total_start": NaN, "max_medals": 2182, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 181, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 3, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 523, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 12, "rb": 4, "art": 16, "total_start": NaN, "max_medals": 1101, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 4, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 887, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 1, "art": 8, "total_start": NaN, "max_medals": 545, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 6, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 610, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 25, "rb": 7, "art": 25, "total_start": NaN, "max_medals": 1475, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 9, "rb": 3, "art": 16, "total_start": NaN, "max_medals": 1028, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 30, "rb": 5, "art": 18, "total_start": NaN, "max_medals": 5080, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 4, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 548, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 23, "rb": 0, "art": 18, "total_start": NaN, "max_medals": 1637, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 504, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 11, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 493, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 103, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 3, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 260, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 103, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 28, "rb": 0, "art": 46, "total_start": NaN, "max_medals": 4682, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 17, "rb": 0, "art": 36, "total_start": NaN, "max_medals": 4013, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 11, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 339, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 8, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 535, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 50, "rb": 0, "art": 85, "total_start": NaN, "max_medals": 7339, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 5, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 250, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 20, "rb": 0, "art": 16, "total_start": NaN, "max_medals": 614, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 9, "art": 39, "total_start": NaN, "max_medals": 2814, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 9, "art": 41, "total_start": NaN, "max_medals": 2457, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 12, "art": 45, "total_start": NaN, "max_medals": 1605, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 16, "art": 35, "total_start": NaN, "max_medals": 1562, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 20, "art": 73, "total_start": NaN, "max_medals": 4465, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 6, "art": 30, "total_start": NaN, "max_medals": 1184, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 21, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 986, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 938, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 12, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1154, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1107, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 6, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 503, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 24, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 987, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 10, "art": 25, "total_start": NaN, "max_medals": 705, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 4, "art": 21, "total_start": NaN, "max_medals": 1234, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 18, "total_start": NaN, "max_medals": 1064, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 14, "total_start": NaN, "max_medals": 694, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 12, "art": 36, "total_start": NaN, "max_medals": 1618, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 12, "art": 71, "total_start": NaN, "max_medals": 11245, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 18, "art": 53, "total_start": NaN, "max_medals": 2564, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 22, "art": 70, "total_start": NaN, "max_medals": 3817, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 17, "art": 75, "total_start": NaN, "max_medals": 5037, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 25, "art": 74, "total_start": NaN, "max_medals": 2547, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 19, "art": 85, "total_start": NaN, "max_medals": 5609, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 28, "art": 61, "total_start": NaN, "max_medals": 1280, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 4, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 662, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 735, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 25, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 2784, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 1, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 471, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 733, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 4, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 449, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 23, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 967, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 18, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1217, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1042, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 23, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1368, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 21, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 812, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 28, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1623, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 12, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 862, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 8, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 969, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1282, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 10, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 587, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 12, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 589, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 21, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1749, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 15, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1168, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 15, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 736, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 13, "art": 31, "total_start": NaN, "max_medals": 2878, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 24, "art": 38, "total_start": NaN, "max_medals": 7397, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 30, "art": 42, "total_start": NaN, "max_medals": 14809, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 15, "art": 30, "total_start": NaN, "max_medals": 2336, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 21, "total_start": NaN, "max_medals": 3397, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 3, "art": 30, "total_start": NaN, "max_medals": 1569, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 29, "total_start": NaN, "max_medals": 1680, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 28, "total_start": NaN, "max_medals": 1566, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 16, "art": 32, "total_start": NaN, "max_medals": 1047, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 20, "art": 53, "total_start": NaN, "max_medals": 8280, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 19, "art": 36, "total_start": NaN, "max_medals": 2468, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 21, "art": 45, "total_start": NaN, "max_medals": 3546, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 42, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 7648, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 13, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1431, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 17, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 2177, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 24, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2668, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 13, "art": 25, "total_start": NaN, "max_medals": 1504, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 8, "art": 26, "total_start": NaN, "max_medals": 5803, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 4, "art": 5, "total_start": NaN, "max_medals": 675, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 8, "art": 13, "total_start": NaN, "max_medals": 1053, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 18, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1512, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 33, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 2037, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 28, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1563, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 458, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 407, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 17, "art": 56, "total_start": NaN, "max_medals": 4929, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 12, "art": 21, "total_start": NaN, "max_medals": 3522, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 8, "art": 20, "total_start": NaN, "max_medals": 1023, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 11, "art": 25, "total_start": NaN, "max_medals": 3762, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 6, "art": 11, "total_start": NaN, "max_medals": 887, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 7, "art": 14, "total_start": NaN, "max_medals": 780, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 9, "art": 27, "total_start": NaN, "max_medals": 3401, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 9, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 3975, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 1169, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 723, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 6, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 743, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 26, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 2114, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 883, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 348, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 17, "rb": 0, "art": 41, "total_start": NaN, "max_medals": 6222, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 13, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 1738, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 21, "rb": 0, "art": 34, "total_start": NaN, "max_medals": 2905, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 27, "rb": 0, "art": 32, "total_start": NaN, "max_medals": 2811, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 13, "art": 31, "total_start": NaN, "max_medals": 1494, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 17, "art": 37, "total_start": NaN, "max_medals": 4910, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 8, "art": 21, "total_start": NaN, "max_medals": 797, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 540, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1333, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 16, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1214, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 2, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 552, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 780, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 11, "art": 7, "total_start": NaN, "max_medals": 515, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 5, "art": 2, "total_start": NaN, "max_medals": 344, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 30, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 8787, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 13, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 4031, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 15, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 1226, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 20, "rb": 29, "art": 0, "total_start": NaN, "max_medals": 1300, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 11, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 573, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 20, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 2100, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 11, "rb": 0, "art": 18, "total_start": NaN, "max_medals": 2233, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 2, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 531, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 4, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 2047, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 8, "art": 27, "total_start": NaN, "max_medals": 844, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 6, "art": 34, "total_start": NaN, "max_medals": 1298, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 5, "art": 37, "total_start": NaN, "max_medals": 1979, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 22, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2028, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 563, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 7, "art": 38, "total_start": NaN, "max_medals": 2690, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 8, "art": 41, "total_start": NaN, "max_medals": 1795, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 620, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 14, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1305, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 7, "art": 33, "total_start": NaN, "max_medals": 7349, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 24, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 1811, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 19, "art": 44, "total_start": NaN, "max_medals": 1403, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 10, "art": 21, "total_start": NaN, "max_medals": 2853, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 9, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 7, "art": 21, "total_start": NaN, "max_medals": 1451, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 5, "art": 4, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 6, "art": 20, "total_start": NaN, "max_medals": 1430, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 0, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 504, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 9, "art": 23, "total_start": NaN, "max_medals": 3133, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1103, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 16, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1850, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 49, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 2973, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 8, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 1749, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 11, "art": 37, "total_start": NaN, "max_medals": 1325, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 4568, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 12, "art": 46, "total_start": NaN, "max_medals": 2008, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 8, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 785, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 12, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 248, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 5, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 1065, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 25, "art": 21, "total_start": NaN, "max_medals": 649, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 3, "art": 10, "total_start": NaN, "max_medals": 1513, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 10, "art": 39, "total_start": NaN, "max_medals": 4831, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 13, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 4047, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 771, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 24, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 1530, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 254, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 17, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 710, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 3227, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 30, "art": 67, "total_start": NaN, "max_medals": 2468, "diff_medals": NaN}, {"date": "2026-02-11", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 2, "art": 15, "total_start": NaN, "max_medals": 1535, "diff_medals": NaN}]);
@@ -0,0 +1 @@
+DATA_CHUNKS.push([{"date": "2026-02-12", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 382, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 912, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1581, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 790, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 635, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 2235, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1227, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 770, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 609, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2801, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1223, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 28, "art": 0, "total_start": NaN, "max_medals": 1894, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1826, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 1680, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 3327, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 371, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1455, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 565, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 2196, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1122, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1165, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 479, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 2564, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 540, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 509, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 3379, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 622, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 975, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 515, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 32, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 2617, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 633, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 673, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1985, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 257, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 614, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1877, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1076, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2750, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1718, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 4, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 513, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1659, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2595, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3804, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1365, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 22, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 3792, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 930, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1170, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2435, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 17, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2814, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 489, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1275, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1352, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 596, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1482, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 3410, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 226, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 4, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 925, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 4153, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 19, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1406, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 970, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2735, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1399, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1708, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 9, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1761, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2358, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 7, "art": 16, "total_start": NaN, "max_medals": 599, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 12, "art": 48, "total_start": NaN, "max_medals": 3362, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 8, "art": 29, "total_start": NaN, "max_medals": 2061, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 39, "total_start": NaN, "max_medals": 2924, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 28, "art": 90, "total_start": NaN, "max_medals": 5715, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 2, "art": 7, "total_start": NaN, "max_medals": 733, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 23, "total_start": NaN, "max_medals": 2131, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 53, "total_start": NaN, "max_medals": 6913, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 11, "total_start": NaN, "max_medals": 694, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 25, "total_start": NaN, "max_medals": 1185, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 6, "art": 28, "total_start": NaN, "max_medals": 3039, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 39, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 5, "art": 15, "total_start": NaN, "max_medals": 819, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 26, "total_start": NaN, "max_medals": 1108, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 9, "art": 16, "total_start": NaN, "max_medals": 781, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 30, "total_start": NaN, "max_medals": 1151, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 16, "total_start": NaN, "max_medals": 798, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 16, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1535, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 2799, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 347, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 10, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 866, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 364, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 4, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 262, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 346, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 802, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 427, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 972, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 882, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 10, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 601, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 488, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 953, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 6, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 790, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 970, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 44, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 4556, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 134, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 8, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1695, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 4561, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1847, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1553, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 221, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1845, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 674, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 17, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 2999, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 3, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 801, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 23, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 3310, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 2, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 666, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 27, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 5329, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 779, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1391, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 20, "total_start": NaN, "max_medals": 1073, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 19, "art": 74, "total_start": NaN, "max_medals": 3351, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 4, "art": 9, "total_start": NaN, "max_medals": 500, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 61, "total_start": NaN, "max_medals": 6832, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 71, "total_start": NaN, "max_medals": 6629, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 46, "total_start": NaN, "max_medals": 4682, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 23, "art": 83, "total_start": NaN, "max_medals": 3791, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 13, "art": 49, "total_start": NaN, "max_medals": 1515, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 96, "total_start": NaN, "max_medals": 10236, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 1, "art": 7, "total_start": NaN, "max_medals": 931, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 174, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 4, "art": 16, "total_start": NaN, "max_medals": 1005, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 12, "art": 39, "total_start": NaN, "max_medals": 1107, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 16, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 6, "art": 13, "total_start": NaN, "max_medals": 694, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 20, "art": 84, "total_start": NaN, "max_medals": 4649, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 11, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 983, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 19, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 1682, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 509, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 403, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 24, "rb": 5, "art": 9, "total_start": NaN, "max_medals": 2558, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 4, "art": 12, "total_start": NaN, "max_medals": 1254, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 15, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 6, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 919, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 10, "rb": 2, "art": 5, "total_start": NaN, "max_medals": 1465, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 14, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 1972, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 16, "art": 54, "total_start": NaN, "max_medals": 6459, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 27, "art": 59, "total_start": NaN, "max_medals": 3022, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 5, "art": 6, "total_start": NaN, "max_medals": 289, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 6, "art": 10, "total_start": NaN, "max_medals": 815, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 14, "total_start": NaN, "max_medals": 595, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 40, "total_start": NaN, "max_medals": 2507, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 69, "total_start": NaN, "max_medals": 9466, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 9, "art": 18, "total_start": NaN, "max_medals": 2150, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 21, "total_start": NaN, "max_medals": 2232, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 8, "art": 8, "total_start": NaN, "max_medals": 303, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 37, "total_start": NaN, "max_medals": 2189, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 38, "total_start": NaN, "max_medals": 4879, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 21, "total_start": NaN, "max_medals": 2019, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 58, "total_start": NaN, "max_medals": 9945, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 28, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2751, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 999, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 783, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 23, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1638, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1215, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1177, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 27, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 1845, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 18, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 34, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 2615, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1497, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 33, "rb": 32, "art": 0, "total_start": NaN, "max_medals": 3793, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 246, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 10, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 788, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 18, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 779, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 35, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3513, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 18, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1798, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 33, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 2722, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 2, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 503, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 699, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1634, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1278, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 569, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 15, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1025, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1013, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 11, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1147, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 8, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1405, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1262, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 667, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 417, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 1, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 287, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 19, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1956, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 13, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1012, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 12, "art": 38, "total_start": NaN, "max_medals": 6248, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 13, "art": 23, "total_start": NaN, "max_medals": 1458, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 41, "total_start": NaN, "max_medals": 2258, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 34, "total_start": NaN, "max_medals": 1596, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 15, "art": 33, "total_start": NaN, "max_medals": 1274, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 14, "art": 12, "total_start": NaN, "max_medals": 763, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 23, "art": 37, "total_start": NaN, "max_medals": 2999, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 17, "art": 38, "total_start": NaN, "max_medals": 2146, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 5, "rb": 5, "art": 2, "total_start": NaN, "max_medals": 785, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 15, "rb": 11, "art": 8, "total_start": NaN, "max_medals": 1086, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 2, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 190, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 8, "rb": 6, "art": 5, "total_start": NaN, "max_medals": 319, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 10, "rb": 18, "art": 1, "total_start": NaN, "max_medals": 4792, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 3, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 260, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 7, "rb": 6, "art": 3, "total_start": NaN, "max_medals": 1338, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 12, "rb": 12, "art": 3, "total_start": NaN, "max_medals": 3144, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 5, "art": 39, "total_start": NaN, "max_medals": 3544, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1046, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 11, "art": 41, "total_start": NaN, "max_medals": 5223, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 8, "art": 13, "total_start": NaN, "max_medals": 527, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 11, "art": 29, "total_start": NaN, "max_medals": 4733, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 1, "art": 9, "total_start": NaN, "max_medals": 1063, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 0, "rb": 3, "art": 4, "total_start": NaN, "max_medals": 85, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 0, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 21, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 6, "art": 9, "total_start": NaN, "max_medals": 843, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 3, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 321, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 1, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 279, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 1741, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 14, "rb": 8, "art": 20, "total_start": NaN, "max_medals": 2063, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 4, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 3, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 334, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 10, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 944, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 317, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 3, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 709, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 9, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 2994, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 16, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 900, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 31, "rb": 0, "art": 18, "total_start": NaN, "max_medals": 526, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 17, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 9, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 461, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 9, "art": 28, "total_start": NaN, "max_medals": 2251, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 129, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 105, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1698, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 1, "art": 11, "total_start": NaN, "max_medals": 937, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 13, "art": 38, "total_start": NaN, "max_medals": 2268, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 845, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 19, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 4, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 333, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 247, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 750, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 0, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 110, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 326, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 899, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 1478, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 17, "total_start": NaN, "max_medals": 2157, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 11, "total_start": NaN, "max_medals": 582, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 546, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 3, "art": 22, "total_start": NaN, "max_medals": 2066, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 274, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 22, "rb": 3, "art": 6, "total_start": NaN, "max_medals": 2447, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 1, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 391, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1198, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1118, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 13, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1363, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 27, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1677, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 2145, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 264, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 12, "rb": 32, "art": 0, "total_start": NaN, "max_medals": 790, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 921, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 27, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 2025, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 811, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 11, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 924, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 689, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 12, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 988, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 249, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 172, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 5, "art": 7, "total_start": NaN, "max_medals": 1259, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 10, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 508, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 24, "total_start": NaN, "max_medals": 1415, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 37, "total_start": NaN, "max_medals": 7570, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 12, "total_start": NaN, "max_medals": 1058, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 3165, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 7, "art": 12, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 192, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 3, "art": 10, "total_start": NaN, "max_medals": 939, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 24, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 5824, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 12, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2408, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 688, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 456, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 479, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 23, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 4, "art": 17, "total_start": NaN, "max_medals": 3135, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 11, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1058, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1378, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1296, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 2, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 254, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 8, "art": 16, "total_start": NaN, "max_medals": 1934, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 1082, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 4, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 212, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 3006, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 75, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 2, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 569, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 822, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 4, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 735, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 11, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 2294, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 7, "rb": 0, "art": 20, "total_start": NaN, "max_medals": 4126, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 873, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 5, "total_start": NaN, "max_medals": 599, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 846, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 612, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 13, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2200, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 28, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 2, "art": 9, "total_start": NaN, "max_medals": 1528, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 10, "art": 17, "total_start": NaN, "max_medals": 1748, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 470, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 87, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 83, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 6, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 355, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 908, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 422, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 32, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1997, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 2, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 499, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 101, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 1, "art": 7, "total_start": NaN, "max_medals": 771, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 1, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 496, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 110, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 10, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 17, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 357, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 1477, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 18, "art": 45, "total_start": NaN, "max_medals": 1317, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 2, "art": 12, "total_start": NaN, "max_medals": 2027, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 5, "art": 2, "total_start": NaN, "max_medals": 90, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 3, "art": 4, "total_start": NaN, "max_medals": 703, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 12, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 8, "rb": 0, "art": 51, "total_start": NaN, "max_medals": 4825, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 4, "art": 14, "total_start": NaN, "max_medals": 1511, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 13, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1861, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 854, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 20, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1291, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 111, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 453, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 6, "art": 24, "total_start": NaN, "max_medals": 4481, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 4, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 891, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 19, "rb": 0, "art": 35, "total_start": NaN, "max_medals": 2146, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 21, "art": 30, "total_start": NaN, "max_medals": 1664, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 851, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 4, "art": 4, "total_start": NaN, "max_medals": 487, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 3, "art": 3, "total_start": NaN, "max_medals": 328, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 9, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 536, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 15, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 1240, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 33, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 1122, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 3, "art": 8, "total_start": NaN, "max_medals": 1558, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 186, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 2, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 638, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 15, "art": 43, "total_start": NaN, "max_medals": 3285, "diff_medals": NaN}, {"date": "2026-02-12", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 3, "art": 26, "total_start": NaN, "max_medals": 1923, "diff_medals": NaN}]);
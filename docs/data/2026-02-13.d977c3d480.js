@@ -0,0 +1 @@
+DATA_CHUNKS.push([{"date": "2026-02-13", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1619, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2367, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 584, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 779, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 20, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1507, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 995, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1532, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1697, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 345, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 942, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 380, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 645, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1270, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1249, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 1961, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1486, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 537, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 2208, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 619, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 970, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 5, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 490, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 598, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 736, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 487, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1797, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 639, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1069, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 2761, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1275, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1156, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 484, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1241, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 8, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 588, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 2, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 351, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 24, "rb": 29, "art": 0, "total_start": NaN, "max_medals": 1787, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1094, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1086, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 6, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 757, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 635, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 2707, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1963, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 729, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1691, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 717, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1408, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2280, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1254, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 989, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1182, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1029, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1298, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 792, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 22, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 3989, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 15, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 834, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 12, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1872, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 11, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1151, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1425, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1020, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2002, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 19, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2800, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 25, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3419, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 27, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 3611, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 11, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1495, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2028, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 41, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 7343, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 20, "art": 60, "total_start": NaN, "max_medals": 4810, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 50, "total_start": NaN, "max_medals": 2147, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 25, "total_start": NaN, "max_medals": 804, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 24, "total_start": NaN, "max_medals": 1623, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 49, "total_start": NaN, "max_medals": 6558, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 35, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 20, "art": 63, "total_start": NaN, "max_medals": 3911, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 18, "art": 35, "total_start": NaN, "max_medals": 561, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 18, "art": 56, "total_start": NaN, "max_medals": 2734, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 9, "art": 36, "total_start": NaN, "max_medals": 3173, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 8, "art": 12, "total_start": NaN, "max_medals": 375, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 21, "art": 49, "total_start": NaN, "max_medals": 2625, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 478, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 17, "art": 86, "total_start": NaN, "max_medals": 9468, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 12, "art": 37, "total_start": NaN, "max_medals": 881, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 3111, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 43, "total_start": NaN, "max_medals": 2317, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 20, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1747, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 127, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 21, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 12, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 658, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 120, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 285, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 14, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1467, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 460, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 18, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1866, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1523, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 4, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 489, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 369, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 181, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 105, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 11, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 1135, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 19, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2658, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 1, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 501, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 966, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 2605, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 4105, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 22, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 2755, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1106, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 16, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1662, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 596, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 976, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 9, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 605, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 11, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1431, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1671, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 9, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1684, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 921, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 17, "art": 39, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 476, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 80, "total_start": NaN, "max_medals": 5706, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 23, "total_start": NaN, "max_medals": 925, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 426, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 36, "total_start": NaN, "max_medals": 944, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 27, "total_start": NaN, "max_medals": 1392, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 50, "total_start": NaN, "max_medals": 3839, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 8, "art": 15, "total_start": NaN, "max_medals": 464, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 4, "art": 10, "total_start": NaN, "max_medals": 652, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 20, "art": 72, "total_start": NaN, "max_medals": 2096, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 6, "art": 58, "total_start": NaN, "max_medals": 8295, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 7, "art": 39, "total_start": NaN, "max_medals": 3797, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 10, "art": 60, "total_start": NaN, "max_medals": 6152, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 32, "total_start": NaN, "max_medals": 2031, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 9, "art": 24, "total_start": NaN, "max_medals": 845, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 22, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 3153, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 22, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 1373, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 159, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 27, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 4116, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 40, "rb": 5, "art": 10, "total_start": NaN, "max_medals": 2889, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 50, "rb": 3, "art": 12, "total_start": NaN, "max_medals": 3875, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 465, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 72, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 9871, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 102, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 149, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 419, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 20, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 1969, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 2, "art": 3, "total_start": NaN, "max_medals": 813, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 3, "art": 8, "total_start": NaN, "max_medals": 600, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 10, "art": 31, "total_start": NaN, "max_medals": 7857, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 19, "total_start": NaN, "max_medals": 635, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 12, "art": 14, "total_start": NaN, "max_medals": 858, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 9, "art": 17, "total_start": NaN, "max_medals": 2446, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 11, "art": 39, "total_start": NaN, "max_medals": 3322, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 18, "total_start": NaN, "max_medals": 1050, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 23, "art": 35, "total_start": NaN, "max_medals": 2603, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 34, "total_start": NaN, "max_medals": 1985, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 28, "art": 58, "total_start": NaN, "max_medals": 6056, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 6, "art": 30, "total_start": NaN, "max_medals": 6014, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 19, "art": 38, "total_start": NaN, "max_medals": 4328, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 5, "art": 5, "total_start": NaN, "max_medals": 353, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 24, "art": 47, "total_start": NaN, "max_medals": 6592, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 14, "total_start": NaN, "max_medals": 949, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 955, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 9, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 850, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 2, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 294, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 699, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 399, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1002, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 715, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 21, "rb": 29, "art": 0, "total_start": NaN, "max_medals": 1592, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 3, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 445, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 17, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1370, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 26, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 38, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 4551, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 752, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 10, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 781, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 10, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 894, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 745, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 21, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1419, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 22, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1928, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 14, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1188, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 659, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 16, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 932, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 22, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1386, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 29, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2237, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 17, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1019, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 16, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1458, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 36, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3409, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 18, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1088, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 33, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1792, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 87, "rb": 28, "art": 0, "total_start": NaN, "max_medals": 13776, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 623, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 80, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 11700, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 47, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 4669, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 20, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 3111, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 30, "total_start": NaN, "max_medals": 1059, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 47, "total_start": NaN, "max_medals": 2326, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 24, "art": 25, "total_start": NaN, "max_medals": 831, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 43, "total_start": NaN, "max_medals": 5714, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 21, "art": 21, "total_start": NaN, "max_medals": 3523, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 12, "art": 28, "total_start": NaN, "max_medals": 1503, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 14, "art": 16, "total_start": NaN, "max_medals": 1845, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 33, "total_start": NaN, "max_medals": 3277, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 24, "rb": 45, "art": 8, "total_start": NaN, "max_medals": 6180, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 9, "rb": 8, "art": 4, "total_start": NaN, "max_medals": 1097, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 13, "art": 9, "total_start": NaN, "max_medals": 1235, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 14, "rb": 9, "art": 6, "total_start": NaN, "max_medals": 1566, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 10, "art": 7, "total_start": NaN, "max_medals": 793, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 12, "rb": 10, "art": 3, "total_start": NaN, "max_medals": 2236, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 32, "rb": 25, "art": 17, "total_start": NaN, "max_medals": 1346, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 16, "rb": 20, "art": 6, "total_start": NaN, "max_medals": 5573, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 2, "total_start": NaN, "max_medals": 243, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 15, "total_start": NaN, "max_medals": 1576, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 20, "art": 69, "total_start": NaN, "max_medals": 4100, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 14, "total_start": NaN, "max_medals": 1170, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 167, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 11, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 13, "art": 69, "total_start": NaN, "max_medals": 8822, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 5, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 3, "art": 13, "total_start": NaN, "max_medals": 1373, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 31, "rb": 3, "art": 11, "total_start": NaN, "max_medals": 6509, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 5, "art": 13, "total_start": NaN, "max_medals": 2063, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 6, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 937, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 3, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 525, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 4, "art": 13, "total_start": NaN, "max_medals": 3516, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 15, "rb": 5, "art": 14, "total_start": NaN, "max_medals": 3131, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 63, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 3, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 20, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 2508, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 5, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 979, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 5, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 1247, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 320, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 9, "rb": 0, "art": 7, "total_start": NaN, "max_medals": 818, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 29, "rb": 0, "art": 38, "total_start": NaN, "max_medals": 3294, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 2, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 122, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 16, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 983, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 20, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 1328, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 13, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 830, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 1, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 130, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 147, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 295, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 721, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 890, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 719, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 10, "art": 29, "total_start": NaN, "max_medals": 1634, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 17, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1273, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1907, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 11, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 812, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 19, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1566, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 676, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 10, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 876, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 5, "art": 25, "total_start": NaN, "max_medals": 1914, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 1422, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 6, "art": 23, "total_start": NaN, "max_medals": 1483, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 8, "art": 19, "total_start": NaN, "max_medals": 849, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 515, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 9, "art": 36, "total_start": NaN, "max_medals": 2639, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 4, "art": 9, "total_start": NaN, "max_medals": 947, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 4, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 8, "art": 12, "total_start": NaN, "max_medals": 941, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 6, "art": 17, "total_start": NaN, "max_medals": 875, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 4, "art": 5, "total_start": NaN, "max_medals": 390, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 2, "art": 4, "total_start": NaN, "max_medals": 423, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 3, "art": 5, "total_start": NaN, "max_medals": 723, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 25, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 423, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 693, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 18, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 827, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 15, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1075, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 914, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 24, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 1577, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 25, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 722, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 819, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 14, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1674, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 630, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 16, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1169, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 14, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 898, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 14, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 715, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 19, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1813, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 6, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 457, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 17, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1343, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 4, "art": 11, "total_start": NaN, "max_medals": 993, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 597, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 105, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 471, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 16, "total_start": NaN, "max_medals": 2001, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 931, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 10, "total_start": NaN, "max_medals": 1014, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 21, "total_start": NaN, "max_medals": 6122, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 15, "art": 39, "total_start": NaN, "max_medals": 3280, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 552, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 7, "art": 10, "total_start": NaN, "max_medals": 514, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 15, "art": 28, "total_start": NaN, "max_medals": 1436, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 249, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 239, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 50, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 10558, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 193, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 7, "total_start": NaN, "max_medals": 1027, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 3, "art": 7, "total_start": NaN, "max_medals": 1831, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 7, "total_start": NaN, "max_medals": 1142, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 311, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 13, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 1008, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 595, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 980, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 25, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1412, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 9, "art": 19, "total_start": NaN, "max_medals": 1226, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 9, "art": 11, "total_start": NaN, "max_medals": 1259, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 5, "art": 35, "total_start": NaN, "max_medals": 7805, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 6, "art": 20, "total_start": NaN, "max_medals": 1924, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 4, "art": 15, "total_start": NaN, "max_medals": 1171, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 85, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 1, "art": 1, "total_start": NaN, "max_medals": 90, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 7, "art": 20, "total_start": NaN, "max_medals": 4199, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1867, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 75, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 999, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 84, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 762, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 11, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1112, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 25, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 1853, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 15, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 996, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 12, "rb": 0, "art": 13, "total_start": NaN, "max_medals": 2539, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 2, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 179, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 4, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 4626, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 12, "rb": 0, "art": 9, "total_start": NaN, "max_medals": 2044, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 15, "art": 35, "total_start": NaN, "max_medals": 6278, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 460, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 12, "art": 32, "total_start": NaN, "max_medals": 1550, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 7, "art": 18, "total_start": NaN, "max_medals": 1332, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 14, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1095, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 3, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 319, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 2, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 389, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 6, "art": 12, "total_start": NaN, "max_medals": 1623, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 9, "art": 40, "total_start": NaN, "max_medals": 7137, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 43, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 5, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 1016, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 8, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 594, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 6, "rb": 0, "art": 3, "total_start": NaN, "max_medals": 625, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 653, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 32, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 2050, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1323, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 486, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 12, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 507, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 17, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 1748, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 3, "art": 85, "total_start": NaN, "max_medals": 7208, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 2, "art": 27, "total_start": NaN, "max_medals": 3643, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 3, "art": 41, "total_start": NaN, "max_medals": 2720, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 11, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1315, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1483, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 3, "art": 18, "total_start": NaN, "max_medals": 1964, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 4, "art": 23, "total_start": NaN, "max_medals": 1002, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 3, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 518, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1799, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 5, "art": 7, "total_start": NaN, "max_medals": 411, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 38, "rb": 0, "art": 27, "total_start": NaN, "max_medals": 3589, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 7, "art": 41, "total_start": NaN, "max_medals": 3813, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 19, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 2, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 133, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 8, "art": 13, "total_start": NaN, "max_medals": 975, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 6, "art": 4, "total_start": NaN, "max_medals": 451, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 86, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 3, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 159, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 10, "art": 18, "total_start": NaN, "max_medals": 1857, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 24, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 3043, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 17, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2942, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 31, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1870, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 4, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 248, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 12, "art": 16, "total_start": NaN, "max_medals": 889, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 7, "art": 30, "total_start": NaN, "max_medals": 4890, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 3, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 668, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 14, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 798, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 4, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 929, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 23, "art": 34, "total_start": NaN, "max_medals": 3018, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 4, "art": 25, "total_start": NaN, "max_medals": 1638, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 5, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 4912, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 37, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1949, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 1, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 109, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 5, "rb": 0, "art": 5, "total_start": NaN, "max_medals": 195, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 9, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1464, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 32, "art": 92, "total_start": NaN, "max_medals": 4947, "diff_medals": NaN}, {"date": "2026-02-13", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 113, "diff_medals": NaN}]);
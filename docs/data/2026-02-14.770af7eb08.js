@@ -0,0 +1 @@
+DATA_CHUNKS.push([{"date": "2026-02-14", "machine_id": "0729", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 14, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1078, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0730", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 7, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 406, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0731", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 30, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 2052, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0732", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 771, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0733", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 891, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0734", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 11, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1018, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0735", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1210, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0736", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 875, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0737", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1564, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0738", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 582, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0739", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 40, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 3377, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0740", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 677, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0741", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 16, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 814, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0742", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 919, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0743", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1773, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0744", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1824, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0745", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1363, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0746", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1526, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0747", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2234, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0748", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 13, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 737, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0749", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1755, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0750", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1144, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0751", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 701, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0752", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 21, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1472, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0753", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1114, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0754", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 27, "rb": 32, "art": 0, "total_start": NaN, "max_medals": 1444, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0755", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 25, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 1231, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0756", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 40, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 2556, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0757", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 34, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1856, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0758", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 28, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1313, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0764", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 18, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1450, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0765", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 15, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 744, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0766", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1223, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0767", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 19, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1280, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0768", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1687, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0769", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 1825, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0775", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 26, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 2057, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0776", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 17, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 1089, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0777", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 9, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 847, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0778", "machine_name": "ネオアイムジャグラーＥＸ", "bb": 31, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1633, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0983", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 34, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 6782, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0984", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 21, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2475, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0985", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1841, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0986", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 6, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 604, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0987", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 745, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0997", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 30, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 3421, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0998", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 14, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 2711, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0999", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2810, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1000", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 20, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 2909, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1001", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 2255, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1002", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 10, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 826, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1003", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1904, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1004", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 51, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 8181, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1005", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 32, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 4392, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1006", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 16, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 3217, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1007", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 13, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 899, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1008", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 18, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1667, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1009", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 28, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 2480, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1010", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 789, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1011", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 8, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1450, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1012", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 38, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 3243, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1013", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 20, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 2663, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1014", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 46, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 6889, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1015", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1357, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1016", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 646, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1017", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 30, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2233, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "1018", "machine_name": "沖ドキ！ＧＯＬＤ－３０", "bb": 19, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 2856, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0577", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 36, "total_start": NaN, "max_medals": 2190, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0578", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 39, "total_start": NaN, "max_medals": 1114, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0579", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0580", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 14, "art": 51, "total_start": NaN, "max_medals": 7346, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0581", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 54, "total_start": NaN, "max_medals": 4275, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0582", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 17, "art": 64, "total_start": NaN, "max_medals": 2605, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0583", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 31, "total_start": NaN, "max_medals": 839, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0584", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 28, "art": 50, "total_start": NaN, "max_medals": 909, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0585", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 35, "total_start": NaN, "max_medals": 2449, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0586", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 36, "total_start": NaN, "max_medals": 1827, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0587", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 18, "art": 58, "total_start": NaN, "max_medals": 3473, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0588", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 13, "art": 29, "total_start": NaN, "max_medals": 745, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0589", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 10, "art": 20, "total_start": NaN, "max_medals": 591, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0590", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 15, "art": 34, "total_start": NaN, "max_medals": 1409, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0591", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 11, "art": 21, "total_start": NaN, "max_medals": 570, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0592", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 55, "total_start": NaN, "max_medals": 2721, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0593", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 16, "art": 37, "total_start": NaN, "max_medals": 1377, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0594", "machine_name": "ＬモンキーターンＶ", "bb": 0, "rb": 17, "art": 58, "total_start": NaN, "max_medals": 4764, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0595", "machine_name": "Ｌスマスロ北斗", "bb": 31, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 833, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0596", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 382, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0597", "machine_name": "Ｌスマスロ北斗", "bb": 21, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 2040, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0598", "machine_name": "Ｌスマスロ北斗", "bb": 8, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 505, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0599", "machine_name": "Ｌスマスロ北斗", "bb": 32, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1589, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0600", "machine_name": "Ｌスマスロ北斗", "bb": 5, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 557, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0601", "machine_name": "Ｌスマスロ北斗", "bb": 45, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1471, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0602", "machine_name": "Ｌスマスロ北斗", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 467, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0603", "machine_name": "Ｌスマスロ北斗", "bb": 15, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 702, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0604", "machine_name": "Ｌスマスロ北斗", "bb": 81, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 3050, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0605", "machine_name": "Ｌスマスロ北斗", "bb": 7, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 749, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0606", "machine_name": "Ｌスマスロ北斗", "bb": 17, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1147, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0607", "machine_name": "Ｌスマスロ北斗", "bb": 15, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1009, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0608", "machine_name": "Ｌスマスロ北斗", "bb": 20, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1715, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0609", "machine_name": "Ｌスマスロ北斗", "bb": 17, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1686, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0610", "machine_name": "Ｌスマスロ北斗", "bb": 22, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1024, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0611", "machine_name": "Ｌスマスロ北斗", "bb": 25, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 1091, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0612", "machine_name": "Ｌスマスロ北斗", "bb": 20, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1156, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0967", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 18, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 2883, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0968", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 14, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 2577, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0969", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1530, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0970", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 933, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0971", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 16, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 1574, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0972", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 6, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 1437, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0973", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 11, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 643, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0974", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 21, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 4456, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0975", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 846, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0976", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 6, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0977", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 41, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 4552, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0978", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 10, "rb": 1, "art": 0, "total_start": NaN, "max_medals": 1276, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0979", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 5, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 1121, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0980", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1178, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0981", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 4, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 717, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0982", "machine_name": "沖ドキ！ＢＬＡＣＫ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 956, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0803", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 39, "total_start": NaN, "max_medals": 997, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0804", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 22, "art": 85, "total_start": NaN, "max_medals": 3570, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0805", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 8, "art": 29, "total_start": NaN, "max_medals": 1323, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0806", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 72, "total_start": NaN, "max_medals": 4873, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0807", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 59, "total_start": NaN, "max_medals": 3577, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0808", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 23, "art": 67, "total_start": NaN, "max_medals": 3277, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0809", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 42, "total_start": NaN, "max_medals": 1519, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0810", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 48, "total_start": NaN, "max_medals": 2077, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0811", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 81, "total_start": NaN, "max_medals": 5815, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0812", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 10, "art": 77, "total_start": NaN, "max_medals": 5846, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0813", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 15, "art": 72, "total_start": NaN, "max_medals": 2345, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0814", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 26, "art": 66, "total_start": NaN, "max_medals": 2019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0815", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 14, "art": 68, "total_start": NaN, "max_medals": 5759, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0816", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 11, "art": 74, "total_start": NaN, "max_medals": 5425, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0817", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 17, "art": 53, "total_start": NaN, "max_medals": 1870, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0818", "machine_name": "Ｌ北斗　転生の章２", "bb": 0, "rb": 16, "art": 49, "total_start": NaN, "max_medals": 1727, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0789", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 68, "rb": 3, "art": 12, "total_start": NaN, "max_medals": 8296, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0790", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 61, "rb": 8, "art": 14, "total_start": NaN, "max_medals": 6042, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0791", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 135, "rb": 1, "art": 10, "total_start": NaN, "max_medals": 16727, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0792", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 85, "rb": 12, "art": 28, "total_start": NaN, "max_medals": 7244, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0793", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 8, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 1326, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0794", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 21, "rb": 7, "art": 23, "total_start": NaN, "max_medals": 851, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0795", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 72, "rb": 5, "art": 16, "total_start": NaN, "max_medals": 5809, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0796", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 120, "rb": 5, "art": 19, "total_start": NaN, "max_medals": 11673, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0797", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 18, "rb": 4, "art": 8, "total_start": NaN, "max_medals": 2189, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0798", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 54, "rb": 5, "art": 19, "total_start": NaN, "max_medals": 4934, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0799", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 9, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 796, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0800", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 47, "rb": 4, "art": 25, "total_start": NaN, "max_medals": 2376, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0801", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 69, "rb": 4, "art": 12, "total_start": NaN, "max_medals": 5031, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0802", "machine_name": "Ｌ革命機ヴァルヴレイヴ２", "bb": 94, "rb": 2, "art": 22, "total_start": NaN, "max_medals": 10423, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0835", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 49, "total_start": NaN, "max_medals": 7271, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0836", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 11, "art": 28, "total_start": NaN, "max_medals": 5157, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0837", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 51, "total_start": NaN, "max_medals": 8139, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0838", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 26, "total_start": NaN, "max_medals": 2358, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0839", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 21, "art": 36, "total_start": NaN, "max_medals": 4483, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0840", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 15, "art": 19, "total_start": NaN, "max_medals": 1140, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0841", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 18, "art": 22, "total_start": NaN, "max_medals": 1736, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0842", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 17, "art": 27, "total_start": NaN, "max_medals": 2628, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0843", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 26, "art": 26, "total_start": NaN, "max_medals": 528, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0844", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 34, "art": 53, "total_start": NaN, "max_medals": 3123, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0845", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 14, "art": 23, "total_start": NaN, "max_medals": 2477, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0846", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 37, "total_start": NaN, "max_medals": 3489, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0847", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 20, "art": 24, "total_start": NaN, "max_medals": 4369, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0848", "machine_name": "Ｌ東京喰種", "bb": 0, "rb": 22, "art": 26, "total_start": NaN, "max_medals": 1222, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0701", "machine_name": "ゴーゴージャグラー３", "bb": 36, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 2322, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0702", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 855, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0703", "machine_name": "ゴーゴージャグラー３", "bb": 33, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2304, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0704", "machine_name": "ゴーゴージャグラー３", "bb": 26, "rb": 34, "art": 0, "total_start": NaN, "max_medals": 2201, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0705", "machine_name": "ゴーゴージャグラー３", "bb": 13, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1200, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0706", "machine_name": "ゴーゴージャグラー３", "bb": 8, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 650, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0707", "machine_name": "ゴーゴージャグラー３", "bb": 36, "rb": 25, "art": 0, "total_start": NaN, "max_medals": 1709, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0708", "machine_name": "ゴーゴージャグラー３", "bb": 24, "rb": 26, "art": 0, "total_start": NaN, "max_medals": 1163, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0709", "machine_name": "ゴーゴージャグラー３", "bb": 28, "rb": 27, "art": 0, "total_start": NaN, "max_medals": 2101, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0710", "machine_name": "ゴーゴージャグラー３", "bb": 12, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 593, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0711", "machine_name": "ゴーゴージャグラー３", "bb": 16, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1170, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0712", "machine_name": "ゴーゴージャグラー３", "bb": 9, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 513, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0713", "machine_name": "ゴーゴージャグラー３", "bb": 21, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 1294, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0714", "machine_name": "ゴーゴージャグラー３", "bb": 41, "rb": 33, "art": 0, "total_start": NaN, "max_medals": 3841, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0779", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 14, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 1093, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0780", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 23, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1278, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0781", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 11, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 1063, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0782", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 24, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 817, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0783", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 18, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 947, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0784", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 20, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 916, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0785", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 19, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1095, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0786", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 32, "rb": 22, "art": 0, "total_start": NaN, "max_medals": 2286, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0787", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 553, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0788", "machine_name": "Ｓファンキージャグラー２ＫＴ", "bb": 45, "rb": 31, "art": 0, "total_start": NaN, "max_medals": 4135, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0988", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 18, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0989", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 62, "rb": 24, "art": 0, "total_start": NaN, "max_medals": 7674, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0990", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 31, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 1908, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0991", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 40, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 3400, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0992", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 43, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 5715, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0993", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 54, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 8401, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0994", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 56, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 6079, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0995", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 43, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 3894, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0996", "machine_name": "Ｌ沖ドキ！ＤＵＯ　アンコール", "bb": 39, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 4127, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0317", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 22, "art": 50, "total_start": NaN, "max_medals": 3888, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0318", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 26, "art": 29, "total_start": NaN, "max_medals": 1448, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0319", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 33, "total_start": NaN, "max_medals": 2019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0320", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 23, "art": 38, "total_start": NaN, "max_medals": 4005, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0321", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 18, "art": 24, "total_start": NaN, "max_medals": 1490, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0322", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 20, "art": 42, "total_start": NaN, "max_medals": 4880, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0323", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 17, "art": 55, "total_start": NaN, "max_medals": 4354, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0324", "machine_name": "Ｌ炎炎ノ消防隊２", "bb": 0, "rb": 19, "art": 26, "total_start": NaN, "max_medals": 999, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0325", "machine_name": "Ｌ鉄拳６", "bb": 30, "rb": 43, "art": 11, "total_start": NaN, "max_medals": 6724, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0326", "machine_name": "Ｌ鉄拳６", "bb": 15, "rb": 9, "art": 5, "total_start": NaN, "max_medals": 1325, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0327", "machine_name": "Ｌ鉄拳６", "bb": 24, "rb": 15, "art": 9, "total_start": NaN, "max_medals": 1754, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0328", "machine_name": "Ｌ鉄拳６", "bb": 12, "rb": 9, "art": 4, "total_start": NaN, "max_medals": 1478, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0329", "machine_name": "Ｌ鉄拳６", "bb": 22, "rb": 14, "art": 9, "total_start": NaN, "max_medals": 1463, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0330", "machine_name": "Ｌ鉄拳６", "bb": 14, "rb": 5, "art": 4, "total_start": NaN, "max_medals": 616, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0331", "machine_name": "Ｌ鉄拳６", "bb": 6, "rb": 7, "art": 7, "total_start": NaN, "max_medals": 317, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0332", "machine_name": "Ｌ鉄拳６", "bb": 17, "rb": 8, "art": 4, "total_start": NaN, "max_medals": 2133, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0819", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 17, "art": 40, "total_start": NaN, "max_medals": 1797, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0820", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 12, "art": 34, "total_start": NaN, "max_medals": 1435, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0821", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 5, "art": 19, "total_start": NaN, "max_medals": 3333, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0822", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 2, "art": 8, "total_start": NaN, "max_medals": 748, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0823", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 15, "art": 40, "total_start": NaN, "max_medals": 3714, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0824", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 15, "art": 60, "total_start": NaN, "max_medals": 1647, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0825", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 4, "art": 31, "total_start": NaN, "max_medals": 1357, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0826", "machine_name": "Ｌからくりサーカス", "bb": 0, "rb": 9, "art": 31, "total_start": NaN, "max_medals": 1205, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0827", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 6, "rb": 5, "art": 16, "total_start": NaN, "max_medals": 857, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0828", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 11, "rb": 5, "art": 7, "total_start": NaN, "max_medals": 1574, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0829", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 34, "rb": 5, "art": 21, "total_start": NaN, "max_medals": 7062, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0830", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 16, "rb": 4, "art": 13, "total_start": NaN, "max_medals": 3031, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0831", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 12, "rb": 6, "art": 23, "total_start": NaN, "max_medals": 665, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0832", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 12, "rb": 7, "art": 17, "total_start": NaN, "max_medals": 473, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0833", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 49, "rb": 4, "art": 15, "total_start": NaN, "max_medals": 9545, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0834", "machine_name": "Ｌかぐや様は告らせたい－Ｖ", "bb": 19, "rb": 6, "art": 26, "total_start": NaN, "max_medals": 1567, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0913", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 827, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0914", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 2, "total_start": NaN, "max_medals": 291, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0915", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 1, "total_start": NaN, "max_medals": 417, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0916", "machine_name": "Ｌ戦国乙女４", "bb": 31, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 1654, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0917", "machine_name": "Ｌ戦国乙女４", "bb": 30, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 2167, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0918", "machine_name": "Ｌ戦国乙女４", "bb": 6, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 1711, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0919", "machine_name": "Ｌ戦国乙女４", "bb": 14, "rb": 0, "art": 11, "total_start": NaN, "max_medals": 3558, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0879", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 28, "rb": 0, "art": 32, "total_start": NaN, "max_medals": 2356, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0880", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 44, "rb": 0, "art": 35, "total_start": NaN, "max_medals": 1433, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0881", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 12, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 598, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0882", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 8, "rb": 0, "art": 4, "total_start": NaN, "max_medals": 255, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0883", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 18, "rb": 0, "art": 20, "total_start": NaN, "max_medals": 1019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0884", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 27, "rb": 0, "art": 32, "total_start": NaN, "max_medals": 2744, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0885", "machine_name": "Ｌバジリスク絆２天膳ＢＬＡＣＫ", "bb": 18, "rb": 0, "art": 24, "total_start": NaN, "max_medals": 2676, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0857", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 14, "art": 35, "total_start": NaN, "max_medals": 2950, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0858", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 11, "art": 24, "total_start": NaN, "max_medals": 1452, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0859", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 11, "art": 37, "total_start": NaN, "max_medals": 4566, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0860", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 1, "art": 12, "total_start": NaN, "max_medals": 379, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0861", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 1, "art": 32, "total_start": NaN, "max_medals": 2742, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0862", "machine_name": "Ｌ新鬼武者３", "bb": 0, "rb": 3, "art": 19, "total_start": NaN, "max_medals": 934, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0723", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 21, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2347, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0724", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 23, "rb": 35, "art": 0, "total_start": NaN, "max_medals": 1466, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0725", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 7, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 750, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0726", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 30, "rb": 23, "art": 0, "total_start": NaN, "max_medals": 1863, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0727", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 17, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1906, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0728", "machine_name": "ハッピージャグラーＶＩＩＩ", "bb": 25, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1436, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0903", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 9, "art": 17, "total_start": NaN, "max_medals": 736, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0904", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 7, "art": 43, "total_start": NaN, "max_medals": 3217, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0905", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 10, "art": 92, "total_start": NaN, "max_medals": 9136, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0906", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 14, "art": 53, "total_start": NaN, "max_medals": 2133, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0907", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 13, "art": 83, "total_start": NaN, "max_medals": 4874, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0908", "machine_name": "Ｌゴッドイーター　リザレクション－Ｖ", "bb": 0, "rb": 6, "art": 21, "total_start": NaN, "max_medals": 1271, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0314", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 9, "art": 29, "total_start": NaN, "max_medals": 1838, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0315", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 13, "art": 53, "total_start": NaN, "max_medals": 5147, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0316", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 16, "art": 44, "total_start": NaN, "max_medals": 2285, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0333", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 4, "art": 22, "total_start": NaN, "max_medals": 1240, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0334", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 15, "art": 43, "total_start": NaN, "max_medals": 1129, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0335", "machine_name": "Ｌモンスターハンターライズ", "bb": 0, "rb": 17, "art": 70, "total_start": NaN, "max_medals": 3709, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0889", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 5, "rb": 1, "art": 3, "total_start": NaN, "max_medals": 769, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0890", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 1, "art": 4, "total_start": NaN, "max_medals": 459, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0891", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 2, "rb": 1, "art": 2, "total_start": NaN, "max_medals": 493, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0892", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 3, "rb": 2, "art": 10, "total_start": NaN, "max_medals": 675, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0893", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 11, "rb": 1, "art": 8, "total_start": NaN, "max_medals": 1403, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0894", "machine_name": "Ｌ革命機ヴァルヴレイヴ", "bb": 45, "rb": 4, "art": 12, "total_start": NaN, "max_medals": 1869, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0759", "machine_name": "ＳマイジャグラーＶ", "bb": 20, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1206, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0760", "machine_name": "ＳマイジャグラーＶ", "bb": 12, "rb": 12, "art": 0, "total_start": NaN, "max_medals": 962, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0761", "machine_name": "ＳマイジャグラーＶ", "bb": 20, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1056, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0762", "machine_name": "ＳマイジャグラーＶ", "bb": 21, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 971, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0763", "machine_name": "ＳマイジャグラーＶ", "bb": 34, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 2255, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0770", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 16, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 1870, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0771", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 7, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 432, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0772", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 10, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 586, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0773", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 15, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 1638, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0774", "machine_name": "ＳアイムジャグラーＥＸ", "bb": 33, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 3385, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0715", "machine_name": "ジャグラーガールズＳＳ", "bb": 28, "rb": 18, "art": 0, "total_start": NaN, "max_medals": 2013, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0716", "machine_name": "ジャグラーガールズＳＳ", "bb": 13, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 571, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0717", "machine_name": "ジャグラーガールズＳＳ", "bb": 21, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1632, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0718", "machine_name": "ジャグラーガールズＳＳ", "bb": 7, "rb": 5, "art": 0, "total_start": NaN, "max_medals": 619, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0909", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 7, "art": 16, "total_start": NaN, "max_medals": 1258, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0910", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 5, "total_start": NaN, "max_medals": 477, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0911", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 2, "art": 6, "total_start": NaN, "max_medals": 1515, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0912", "machine_name": "Ｌとある科学超電磁砲２－⑤", "bb": 0, "rb": 1, "art": 6, "total_start": NaN, "max_medals": 244, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0875", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 0, "art": 37, "total_start": NaN, "max_medals": 11338, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0876", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 38, "total_start": NaN, "max_medals": 5615, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0877", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 34, "total_start": NaN, "max_medals": 8629, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0878", "machine_name": "ＬゴブリンスレイヤーＩＩ－⑤", "bb": 0, "rb": 1, "art": 26, "total_start": NaN, "max_medals": 4445, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0926", "machine_name": "Ｌ化物語", "bb": 0, "rb": 12, "art": 32, "total_start": NaN, "max_medals": 1356, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0927", "machine_name": "Ｌ化物語", "bb": 0, "rb": 22, "art": 53, "total_start": NaN, "max_medals": 2587, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0928", "machine_name": "Ｌ化物語", "bb": 0, "rb": 12, "art": 24, "total_start": NaN, "max_medals": 870, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0929", "machine_name": "Ｌ化物語", "bb": 0, "rb": 27, "art": 55, "total_start": NaN, "max_medals": 2895, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0895", "machine_name": "Ｌチバリヨ２プラス", "bb": 36, "rb": 19, "art": 0, "total_start": NaN, "max_medals": 6318, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0896", "machine_name": "Ｌチバリヨ２プラス", "bb": 4, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 848, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0897", "machine_name": "Ｌチバリヨ２プラス", "bb": 1, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 232, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0898", "machine_name": "Ｌチバリヨ２プラス", "bb": 8, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 822, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0863", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 16, "art": 33, "total_start": NaN, "max_medals": 1833, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0864", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 7, "art": 15, "total_start": NaN, "max_medals": 2333, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0865", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 2, "art": 5, "total_start": NaN, "max_medals": 1100, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0866", "machine_name": "Ｌバイオハザード５", "bb": 0, "rb": 9, "art": 13, "total_start": NaN, "max_medals": 728, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0719", "machine_name": "ウルトラミラクルジャグラー", "bb": 27, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 1086, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0720", "machine_name": "ウルトラミラクルジャグラー", "bb": 18, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1041, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0721", "machine_name": "ウルトラミラクルジャグラー", "bb": 26, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 2402, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0722", "machine_name": "ウルトラミラクルジャグラー", "bb": 3, "rb": 2, "art": 0, "total_start": NaN, "max_medals": 246, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0849", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 9, "art": 18, "total_start": NaN, "max_medals": 1061, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0850", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 7, "art": 25, "total_start": NaN, "max_medals": 6354, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0851", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 13, "art": 17, "total_start": NaN, "max_medals": 2366, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0852", "machine_name": "Ｌ東京リベンジャーズ", "bb": 0, "rb": 8, "art": 32, "total_start": NaN, "max_medals": 3530, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0899", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 9, "art": 31, "total_start": NaN, "max_medals": 5504, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0900", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 6, "art": 27, "total_start": NaN, "max_medals": 5445, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0901", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 7, "art": 11, "total_start": NaN, "max_medals": 756, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0902", "machine_name": "Ｌ主役は銭形５", "bb": 0, "rb": 3, "art": 4, "total_start": NaN, "max_medals": 379, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0867", "machine_name": "Ｌ吉宗", "bb": 6, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 1724, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0868", "machine_name": "Ｌ吉宗", "bb": 1, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 714, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0869", "machine_name": "Ｌ吉宗", "bb": 3, "rb": 9, "art": 0, "total_start": NaN, "max_medals": 751, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0870", "machine_name": "Ｌ吉宗", "bb": 11, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 4219, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0853", "machine_name": "Ｌ秘宝伝－５", "bb": 24, "rb": 14, "art": 0, "total_start": NaN, "max_medals": 6593, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0854", "machine_name": "Ｌ秘宝伝－５", "bb": 14, "rb": 21, "art": 0, "total_start": NaN, "max_medals": 2045, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0855", "machine_name": "Ｌ秘宝伝－５", "bb": 33, "rb": 10, "art": 0, "total_start": NaN, "max_medals": 3630, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0856", "machine_name": "Ｌ秘宝伝－５", "bb": 15, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 2244, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0933", "machine_name": "Ｌマギアレコード", "bb": 9, "rb": 0, "art": 25, "total_start": NaN, "max_medals": 2967, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0934", "machine_name": "Ｌマギアレコード", "bb": 11, "rb": 0, "art": 23, "total_start": NaN, "max_medals": 5812, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0935", "machine_name": "Ｌマギアレコード", "bb": 24, "rb": 0, "art": 30, "total_start": NaN, "max_medals": 5281, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0936", "machine_name": "Ｌマギアレコード", "bb": 16, "rb": 0, "art": 22, "total_start": NaN, "max_medals": 1292, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0871", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 12, "art": 27, "total_start": NaN, "max_medals": 1492, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0872", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 4, "art": 10, "total_start": NaN, "max_medals": 868, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0873", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 6, "art": 11, "total_start": NaN, "max_medals": 1107, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0874", "machine_name": "Ｌいざ！番長", "bb": 0, "rb": 10, "art": 22, "total_start": NaN, "max_medals": 3409, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0307", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 3, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 323, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0308", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 14, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1023, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0309", "machine_name": "ＬＢニューキングハナハナＶ", "bb": 10, "rb": 3, "art": 0, "total_start": NaN, "max_medals": 758, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0930", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 4, "art": 5, "total_start": NaN, "max_medals": 776, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0931", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 15, "art": 30, "total_start": NaN, "max_medals": 1787, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0932", "machine_name": "Ｌダーリン・イン・ザ・フランキス－⑤", "bb": 0, "rb": 8, "art": 19, "total_start": NaN, "max_medals": 2656, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0920", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 15, "rb": 0, "art": 8, "total_start": NaN, "max_medals": 1272, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0921", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 15, "rb": 0, "art": 6, "total_start": NaN, "max_medals": 3117, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0922", "machine_name": "Ｌ　ＴｏＬＯＶＥるダークネスｖｅｒ．８．７", "bb": 36, "rb": 0, "art": 16, "total_start": NaN, "max_medals": 5217, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0311", "machine_name": "Ｌハナビ", "bb": 23, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 1219, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0312", "machine_name": "Ｌハナビ", "bb": 22, "rb": 17, "art": 0, "total_start": NaN, "max_medals": 1197, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0313", "machine_name": "Ｌハナビ", "bb": 7, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 350, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0886", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 14, "rb": 0, "art": 12, "total_start": NaN, "max_medals": 1131, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0887", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 15, "rb": 0, "art": 17, "total_start": NaN, "max_medals": 1701, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0888", "machine_name": "Ｌゴジラ対エヴァンゲリオン－Ｖ", "bb": 20, "rb": 0, "art": 28, "total_start": NaN, "max_medals": 2656, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0923", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 4, "art": 29, "total_start": NaN, "max_medals": 1619, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0924", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 10, "art": 53, "total_start": NaN, "max_medals": 3748, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0925", "machine_name": "Ｌスーパーブラックジャック", "bb": 0, "rb": 2, "art": 61, "total_start": NaN, "max_medals": 3272, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0337", "machine_name": "ＬＢクレアの秘宝伝", "bb": 14, "rb": 15, "art": 0, "total_start": NaN, "max_medals": 1463, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0338", "machine_name": "ＬＢクレアの秘宝伝", "bb": 6, "rb": 6, "art": 0, "total_start": NaN, "max_medals": 435, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0945", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 2, "art": 12, "total_start": NaN, "max_medals": 1155, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0958", "machine_name": "Ｌ頭文字Ｄ　２ｎｄ", "bb": 0, "rb": 2, "art": 21, "total_start": NaN, "max_medals": 2591, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0341", "machine_name": "ＬＢアレックス　ブライト", "bb": 8, "rb": 4, "art": 0, "total_start": NaN, "max_medals": 691, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0342", "machine_name": "ＬＢアレックス　ブライト", "bb": 7, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 687, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0951", "machine_name": "Ｌルパン三世　大航海者の秘宝", "bb": 0, "rb": 16, "art": 32, "total_start": NaN, "max_medals": 2632, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0944", "machine_name": "Ｌ絶対衝激ＩＶ－Ｖ", "bb": 39, "rb": 0, "art": 20, "total_start": NaN, "max_medals": 2539, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0937", "machine_name": "Ｌ無職転生－Ｖ", "bb": 0, "rb": 24, "art": 76, "total_start": NaN, "max_medals": 4019, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0963", "machine_name": "Ｌ忍魂参　奥義皆伝ノ章", "bb": 0, "rb": 6, "art": 26, "total_start": NaN, "max_medals": 8144, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0955", "machine_name": "Ｌ回胴黙示録カイジ　狂宴", "bb": 16, "rb": 7, "art": 0, "total_start": NaN, "max_medals": 975, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0948", "machine_name": "Ｌソードアート・オンライン", "bb": 0, "rb": 12, "art": 10, "total_start": NaN, "max_medals": 502, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0941", "machine_name": "Ｌアリフレタ職業デ世界最強－Ｖ", "bb": 0, "rb": 4, "art": 7, "total_start": NaN, "max_medals": 885, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0960", "machine_name": "Ｌ炎炎ノ消防隊", "bb": 0, "rb": 11, "art": 23, "total_start": NaN, "max_medals": 1295, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0952", "machine_name": "Ｌギルティクラウン２", "bb": 17, "rb": 0, "art": 44, "total_start": NaN, "max_medals": 1773, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0938", "machine_name": "Ｌパチスロ　ラブ嬢３　Ｗご指名", "bb": 0, "rb": 5, "art": 8, "total_start": NaN, "max_medals": 775, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0339", "machine_name": "ＬＢ　ＳＨＡＫＥ　ＢＯＮＵＳ　ＴＲＩＧＧＥＲ", "bb": 5, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 594, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0964", "machine_name": "Ｌひぐらしのなく頃に業", "bb": 0, "rb": 0, "art": 0, "total_start": NaN, "max_medals": 0, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0310", "machine_name": "Ｌうみねこのなく頃に２－Ｖ", "bb": 22, "rb": 20, "art": 0, "total_start": NaN, "max_medals": 2128, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0956", "machine_name": "Ｌガールズ＆パンツァー最終", "bb": 43, "rb": 11, "art": 0, "total_start": NaN, "max_medals": 4514, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0949", "machine_name": "Ｌわたしの幸せな結婚", "bb": 12, "rb": 0, "art": 10, "total_start": NaN, "max_medals": 2845, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0942", "machine_name": "Ｌ押忍！番長４", "bb": 0, "rb": 10, "art": 28, "total_start": NaN, "max_medals": 1466, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0961", "machine_name": "Ｌデビルメイクライ５スタイリッシュトライブ", "bb": 0, "rb": 17, "art": 28, "total_start": NaN, "max_medals": 3256, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0953", "machine_name": "Ｌ範馬刃牙－Ｖ", "bb": 0, "rb": 6, "art": 33, "total_start": NaN, "max_medals": 2652, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0946", "machine_name": "Ｌバーニングエクスプレス－Ｖ", "bb": 7, "rb": 13, "art": 0, "total_start": NaN, "max_medals": 731, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0939", "machine_name": "Ｌ少女☆歌劇レヴュースタァライト－Ｖ", "bb": 17, "rb": 0, "art": 15, "total_start": NaN, "max_medals": 1055, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0340", "machine_name": "Ｌネオプラネット", "bb": 18, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 4683, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0965", "machine_name": "Ｌ攻殻機動隊－Ｖ", "bb": 0, "rb": 26, "art": 18, "total_start": NaN, "max_medals": 1088, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0957", "machine_name": "Ｌ咲－Ｓａｋｉ－頂上決戦", "bb": 0, "rb": 15, "art": 47, "total_start": NaN, "max_medals": 3342, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0950", "machine_name": "Ｌバキ強くなりたくば喰らえ", "bb": 0, "rb": 21, "art": 83, "total_start": NaN, "max_medals": 4239, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0943", "machine_name": "Ｌシャーマンキング－Ｖ", "bb": 12, "rb": 0, "art": 10, "total_start": NaN, "max_medals": 492, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0336", "machine_name": "ＬＢ不二子－Ｖ", "bb": 27, "rb": 16, "art": 0, "total_start": NaN, "max_medals": 2051, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0962", "machine_name": "Ｌマクロスフロンティア４", "bb": 24, "rb": 0, "art": 19, "total_start": NaN, "max_medals": 1650, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0954", "machine_name": "Ｌ麻雀物語", "bb": 0, "rb": 7, "art": 17, "total_start": NaN, "max_medals": 4376, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0947", "machine_name": "Ｌマジカルハロウィン８", "bb": 18, "rb": 0, "art": 29, "total_start": NaN, "max_medals": 1516, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0940", "machine_name": "Ｌ防振り", "bb": 2, "rb": 8, "art": 0, "total_start": NaN, "max_medals": 681, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0966", "machine_name": "ＬアズールレーンＴＨＥ　ＡＮＩＭＡＴＩＯＮ－Ｖ", "bb": 0, "rb": 19, "art": 67, "total_start": NaN, "max_medals": 5096, "diff_medals": NaN}, {"date": "2026-02-14", "machine_id": "0959", "machine_name": "Ｌ転生したら剣でした", "bb": 0, "rb": 7, "art": 37, "total_start": NaN, "max_medals": 1470, "diff_medals": NaN}]);
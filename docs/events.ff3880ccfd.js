@@ -0,0 +1 @@
+const EVENTS = {"index": {}, "events": [], "tables": {}};